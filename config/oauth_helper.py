@@ -15,6 +15,7 @@ import webbrowser
 import subprocess
 import socket
 import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple
 from urllib.parse import urlparse, parse_qs
@@ -187,6 +188,9 @@ class LocalCallbackServer:
         server_instance = self
         
         class CallbackHandler(BaseHTTPRequestHandler):
+            # 受け付けた接続ソケットにTCP_NODELAYを設定（小さな応答をNagleで遅延させない）
+            disable_nagle_algorithm = True
+            
             def do_GET(self):
                 # URLパラメータ解析
                 parsed_url = urlparse(self.path)
@@ -252,6 +256,9 @@ class GmailOAuthHelper:
         self.token_file = config_dir / "gmail_token.json"
         self.keychain_manager = keychain_manager
         
+        # 最後に読み込み・保存したトークンの有効期限（プロセス内キャッシュ）
+        self._cached_expiry: Optional[datetime] = None
+        
         # ログ設定
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -381,9 +388,11 @@ class GmailOAuthHelper:
                     token_uri=token_data.get('token_uri'),
                     client_id=token_data.get('client_id'),
                     client_secret=token_data.get('client_secret'),
-                    scopes=token_data.get('scopes')
+                    scopes=token_data.get('scopes'),
+                    expiry=datetime.fromisoformat(token_data['expiry']) if token_data.get('expiry') else None
                 )
                 
+                self._cached_expiry = credentials.expiry
                 return credentials
             
             # 2. ファイルから読み込み（フォールバック）
@@ -399,9 +408,11 @@ class GmailOAuthHelper:
                     token_uri=token_data.get('token_uri'),
                     client_id=token_data.get('client_id'),
                     client_secret=token_data.get('client_secret'),
-                    scopes=token_data.get('scopes')
+                    scopes=token_data.get('scopes'),
+                    expiry=datetime.fromisoformat(token_data['expiry']) if token_data.get('expiry') else None
                 )
                 
+                self._cached_expiry = credentials.expiry
                 return credentials
             
             self.logger.warning("Gmail認証情報が見つかりません")
@@ -418,6 +429,12 @@ class GmailOAuthHelper:
         Returns:
             bool: 更新成功時True
         """
+        # キャッシュ済み有効期限に余裕があればI/O（Keychain等）を省略
+        if (self._cached_expiry
+                and datetime.utcnow() < self._cached_expiry - timedelta(seconds=60)):
+            self.logger.debug("Gmail認証情報は有効です（キャッシュ判定）")
+            return True
+        
         try:
             self.logger.info("Gmail認証情報更新開始")
             
@@ -465,7 +482,8 @@ class GmailOAuthHelper:
                 'token_uri': credentials.token_uri,
                 'client_id': credentials.client_id,
                 'client_secret': credentials.client_secret,
-                'scopes': credentials.scopes
+                'scopes': credentials.scopes,
+                'expiry': credentials.expiry.isoformat() if credentials.expiry else None
             }
             
             # Keychainに保存
@@ -482,6 +500,8 @@ class GmailOAuthHelper:
             # ファイル権限設定
             os.chmod(self.token_file, 0o600)
             
+            self._cached_expiry = credentials.expiry
+            
             if keychain_success:
                 self.logger.info("Gmail認証情報をKeychainとファイルに保存成功")
                 return True
@@ -9,14 +9,23 @@ with different strategies for each service.
 """
 
 import asyncio
-import time
+import bisect
+import math
 import logging
-from typing import Dict, Optional, Any, Callable, Awaitable
+from time import monotonic_ns
+from typing import Dict, List, Optional, Set, Any, Callable, Awaitable, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import deque
 from enum import Enum
 
 
+# Timestamps are integer nanoseconds from time.monotonic_ns()
+_NS_PER_SEC = 1_000_000_000
+
+# Token counts are fixed-point integers in units of 1/_TOKEN_SCALE token
+_TOKEN_SCALE = 1_000_000
+
+
 class RateLimitStrategy(Enum):
     """Rate limiting strategies"""
     FIXED_WINDOW = "fixed_window"
@@ -25,7 +34,7 @@ class RateLimitStrategy(Enum):
     EXPONENTIAL_BACKOFF = "exponential_backoff"
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimit:
     """Rate limit configuration"""
     requests_per_second: float
@@ -33,6 +42,155 @@ class RateLimit:
     strategy: RateLimitStrategy = field(default=RateLimitStrategy.SLIDING_WINDOW)
     backoff_base: float = field(default=2.0)
     backoff_max: float = field(default=300.0)
+    # Derived once in __post_init__ for the hot path
+    _rps_int: int = field(init=False, repr=False, compare=False)
+    _refill_rate_fp: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Admission is `count < requests_per_second`, i.e. `count < ceil(rps)`
+        self._rps_int = math.ceil(self.requests_per_second)
+        # Token refill rate in fixed-point tokens per second
+        self._refill_rate_fp = round(self.requests_per_second * _TOKEN_SCALE)
+
+
+class _ApiState:
+    """Mutable per-API limiter state, looked up once per request"""
+    
+    __slots__ = (
+        'name', 'limit', 'cond', 'history',
+        'window_id', 'window_count', 'bucket', 'backoff_until', 'backoff_delay',
+        'check', 'deadline', 'take', 'needs_lock'
+    )
+    
+    def __init__(self, name: str, limit: RateLimit):
+        self.name = name
+        self.limit = limit
+        # Per-API lock; also notified when the limit changes (update_limits)
+        self.cond = asyncio.Condition()
+        # Sliding windows: bounded deque of admitted timestamps, oldest first
+        self.history: deque = deque()
+        # Fixed windows: current 1-second window id and requests admitted in it
+        self.window_id = 0
+        self.window_count = 0
+        # Token bucket as [tokens_fp, last_refill_ns]
+        self.bucket: List[int] = [limit.burst_capacity * _TOKEN_SCALE, monotonic_ns()]
+        # Backoff expiry (ns) and the last backoff delay (s)
+        self.backoff_until = 0
+        self.backoff_delay = 1.0
+        # Strategy functions, built by RateLimiter._bind_strategy
+        self.check: Optional[Callable[[int], bool]] = None
+        self.deadline: Optional[Callable[['_ApiState', int], Tuple[bool, int]]] = None
+        self.take: Optional[Callable[['_ApiState', int, int], int]] = None
+        self.needs_lock = True
+        self.init_history()
+    
+    def init_history(self, entries: List[int] = ()) -> None:
+        """
+        (Re)build the sliding window history
+        
+        A window can never hold more than ceil(requests_per_second) admitted
+        requests, so the deque is bounded to exactly that and acts as a ring
+        buffer: appending to a full deque evicts the oldest entry in C. The
+        most recent `entries` (oldest first) are carried over.
+        """
+        size = max(1, self.limit._rps_int)
+        self.history = deque(entries, maxlen=size)
+    
+    def window_requests(self, current_time: int) -> int:
+        """Requests counted against the current window, from hot-path state"""
+        strategy = self.limit.strategy
+        
+        if strategy == RateLimitStrategy.FIXED_WINDOW:
+            return self.window_count if self.window_id == current_time // _NS_PER_SEC else 0
+        
+        if strategy == RateLimitStrategy.SLIDING_WINDOW:
+            history = self.history
+            cutoff_time = current_time - _NS_PER_SEC
+            if not history or history[-1] <= cutoff_time:
+                return 0
+            if history[0] > cutoff_time:
+                return len(history)
+            return len(history) - bisect.bisect_right(history, cutoff_time)
+        
+        return 0
+
+
+class TokenBucket:
+    """
+    Awaitable token bucket for cost-based quotas
+    
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    acquire() waits for the refill instead of rejecting the request, and
+    waiters are served in arrival order.
+    """
+    
+    def __init__(self, name: str, rate: float, capacity: int):
+        """
+        Initialize a full bucket
+        
+        Args:
+            name: API name, used in log messages
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.logger = logging.getLogger(__name__)
+        
+        self._capacity_fp = capacity * _TOKEN_SCALE
+        self._refill_rate_fp = round(rate * _TOKEN_SCALE)
+        self._tokens = self._capacity_fp
+        self._last_refill = monotonic_ns()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self, current_time: int) -> None:
+        """Add the tokens accumulated since the last refill"""
+        if current_time > self._last_refill:
+            self._tokens = min(
+                self._capacity_fp,
+                self._tokens + (current_time - self._last_refill) * self._refill_rate_fp // _NS_PER_SEC
+            )
+            self._last_refill = current_time
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available"""
+        self._refill(monotonic_ns())
+        return max(0, self._tokens) / _TOKEN_SCALE
+    
+    async def acquire(self, cost: int = 1) -> float:
+        """
+        Take `cost` tokens, waiting until they have been refilled
+        
+        Args:
+            cost: Number of tokens (quota units) the request consumes
+            
+        Returns:
+            float: Time waited in seconds
+        """
+        if cost > self.capacity:
+            raise ValueError(f"Cost {cost} exceeds {self.name} bucket capacity {self.capacity}")
+        
+        needed = cost * _TOKEN_SCALE
+        start_time = monotonic_ns()
+        
+        # The head waiter sleeps while holding the lock, so later callers
+        # queue behind it rather than racing for the same refill
+        async with self._lock:
+            self._refill(monotonic_ns())
+            deficit = needed - self._tokens
+            
+            if deficit > 0:
+                wait_ns = -(-deficit * _NS_PER_SEC // self._refill_rate_fp)
+                self.logger.info("Quota bucket %s empty, waiting %.1fs", self.name, wait_ns / _NS_PER_SEC)
+                await asyncio.sleep(wait_ns / _NS_PER_SEC)
+                self._refill(monotonic_ns())
+            
+            # A slightly early wake-up leaves a small debt for the next caller
+            self._tokens -= needed
+        
+        return (monotonic_ns() - start_time) / _NS_PER_SEC
 
 
 class RateLimiter:
@@ -46,6 +204,19 @@ class RateLimiter:
     - Gmail: Conservative sliding window
     """
     
+    # Strategy -> (check builder, deadline method, bulk take method, needs lock)
+    _STRATEGIES = {
+        RateLimitStrategy.SLIDING_WINDOW: (
+            '_compile_sliding_window_check', '_sliding_window_deadline', '_sliding_window_take', True
+        ),
+        RateLimitStrategy.TOKEN_BUCKET: (
+            '_compile_token_bucket_check', '_token_bucket_deadline', '_token_bucket_take', False
+        ),
+        RateLimitStrategy.FIXED_WINDOW: (
+            '_compile_fixed_window_check', '_fixed_window_deadline', '_fixed_window_take', True
+        ),
+    }
+    
     def __init__(self):
         """Initialize rate limiter with API-specific configurations"""
         self.logger = logging.getLogger(__name__)
@@ -74,191 +245,386 @@ class RateLimiter:
             )
         }
         
-        # Internal state tracking
-        self._request_history: Dict[str, deque] = defaultdict(deque)
-        self._token_buckets: Dict[str, Dict[str, Any]] = {}
-        self._backoff_delays: Dict[str, float] = defaultdict(float)
-        self._last_reset: Dict[str, float] = defaultdict(time.time)
-        self._locks: Dict[str, asyncio.Lock] = {
-            api: asyncio.Lock() for api in self.limits.keys()
-        }
+        # Cost-based quota buckets, e.g. `await limiter.youtube.acquire(1)`
+        self.youtube = TokenBucket('youtube', rate=10000 / 86400, capacity=10000)  # 10,000 units/day
+        self.claude = TokenBucket('claude', rate=50 / 60, capacity=50)  # 50 requests/minute
+        self.notion = TokenBucket('notion', rate=3.0, capacity=3)  # 3 requests/second
+        self.gmail = TokenBucket('gmail', rate=250.0, capacity=250)  # 250 quota units/second per user
         
-        # Initialize token buckets
-        for api_name, limit in self.limits.items():
-            self._token_buckets[api_name] = {
-                'tokens': limit.burst_capacity,
-                'capacity': limit.burst_capacity,
-                'refill_rate': limit.requests_per_second,
-                'last_refill': time.time()
-            }
+        # Internal state tracking, one object per API
+        self._state: Dict[str, _ApiState] = {
+            api: _ApiState(api, limit) for api, limit in self.limits.items()
+        }
+        for state in self._state.values():
+            self._bind_strategy(state)
+        # Pending update_limits wake-ups (kept referenced until they run)
+        self._notify_tasks: Set[asyncio.Task] = set()
         
         self.logger.info("Rate limiter initialized with API-specific configurations")
     
-    async def acquire(self, api_name: str, operation: str = "default") -> bool:
+    async def acquire(self, api_name: str, operation: Optional[str] = None) -> bool:
         """
         Acquire permission to make an API request
         
         Args:
             api_name: Name of the API (youtube, claude, notion, gmail)
-            operation: Specific operation name for detailed tracking
+            operation: Unused; accepted for compatibility with existing callers
             
         Returns:
             bool: True if request is allowed, False if rate limited
         """
-        if api_name not in self.limits:
-            self.logger.warning(f"Unknown API name: {api_name}, allowing request")
+        state = self._state.get(api_name)
+        if state is None:
+            self.logger.warning("Unknown API name: %s, allowing request", api_name)
             return True
         
-        async with self._locks[api_name]:
-            limit = self.limits[api_name]
-            current_time = time.time()
-            
-            # Check for active backoff
-            if self._backoff_delays[api_name] > current_time:
-                remaining = self._backoff_delays[api_name] - current_time
-                self.logger.warning(
-                    f"API {api_name} in backoff, waiting {remaining:.1f}s"
-                )
-                return False
-            
-            # Apply strategy-specific rate limiting
-            if limit.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                return await self._sliding_window_check(api_name, current_time)
-            elif limit.strategy == RateLimitStrategy.TOKEN_BUCKET:
-                return await self._token_bucket_check(api_name, current_time)
-            elif limit.strategy == RateLimitStrategy.FIXED_WINDOW:
-                return await self._fixed_window_check(api_name, current_time)
-            else:
-                self.logger.warning(f"Unknown strategy for {api_name}, allowing request")
-                return True
+        # The token bucket check never awaits, so it cannot interleave with
+        # another task on the event loop and needs no lock
+        if not state.needs_lock:
+            return self._try_acquire(state, monotonic_ns())
+        
+        async with state.cond:
+            return self._try_acquire(state, monotonic_ns())
     
-    async def _sliding_window_check(self, api_name: str, current_time: float) -> bool:
-        """Sliding window rate limit check"""
-        limit = self.limits[api_name]
-        history = self._request_history[api_name]
-        window_size = 1.0  # 1 second window
-        
-        # Remove old entries outside the window
-        cutoff_time = current_time - window_size
-        while history and history[0] <= cutoff_time:
-            history.popleft()
-        
-        # Check if we can make another request
-        if len(history) < limit.requests_per_second:
-            history.append(current_time)
-            self.logger.debug(
-                f"API {api_name}: Request allowed ({len(history)}/{limit.requests_per_second})"
-            )
+    def acquire_nowait(self, api_name: str, operation: Optional[str] = None) -> bool:
+        """
+        Acquire permission synchronously, without taking the per-API lock
+        
+        Intended for callers that already serialize access to the API
+        (e.g. a single task issuing requests in a loop).
+        
+        Args:
+            api_name: Name of the API (youtube, claude, notion, gmail)
+            operation: Unused; accepted for compatibility with existing callers
+            
+        Returns:
+            bool: True if request is allowed, False if rate limited
+        """
+        state = self._state.get(api_name)
+        if state is None:
+            self.logger.warning("Unknown API name: %s, allowing request", api_name)
             return True
         
-        # Calculate time until next request is allowed
-        next_available = history[0] + window_size
-        wait_time = next_available - current_time
+        return self._try_acquire(state, monotonic_ns())
+    
+    def _try_acquire(self, state: _ApiState, current_time: int) -> bool:
+        """Run the backoff and strategy checks for an API"""
+        # Check for active backoff
+        if self._in_backoff(state, current_time):
+            return False
+        
+        check = state.check
+        if check is None:
+            self.logger.warning("Unknown strategy for %s, allowing request", state.name)
+            return True
         
-        self.logger.warning(
-            f"API {api_name}: Rate limited, next request in {wait_time:.1f}s"
-        )
-        return False
+        # Apply strategy-specific rate limiting
+        return check(current_time)
     
-    async def _token_bucket_check(self, api_name: str, current_time: float) -> bool:
-        """Token bucket rate limit check"""
-        bucket = self._token_buckets[api_name]
-        limit = self.limits[api_name]
-        
-        # Refill tokens based on elapsed time
-        elapsed = current_time - bucket['last_refill']
-        tokens_to_add = elapsed * bucket['refill_rate']
-        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + tokens_to_add)
-        bucket['last_refill'] = current_time
-        
-        # Check if we have tokens available
-        if bucket['tokens'] >= 1.0:
-            bucket['tokens'] -= 1.0
-            self.logger.debug(
-                f"API {api_name}: Token consumed ({bucket['tokens']:.1f}/{bucket['capacity']} remaining)"
+    def _try_acquire_n(self, state: _ApiState, count: int, current_time: int) -> int:
+        """Grant up to `count` requests in one step and return how many were granted"""
+        if self._in_backoff(state, current_time):
+            return 0
+        
+        take = state.take
+        if take is None:
+            self.logger.warning("Unknown strategy for %s, allowing request", state.name)
+            return count
+        
+        granted = take(state, count, current_time)
+        if granted < count:
+            self.logger.warning(
+                "API %s: Bulk request partially rate limited (%d/%d)", state.name, granted, count
+            )
+        return granted
+    
+    def _bind_strategy(self, state: _ApiState) -> None:
+        """Build the strategy functions for an API once, off the hot path"""
+        entry = self._STRATEGIES.get(state.limit.strategy)
+        if entry is None:
+            state.check = state.deadline = state.take = None
+            state.needs_lock = True
+            return
+        compile_name, deadline_name, take_name, state.needs_lock = entry
+        state.check = getattr(self, compile_name)(state)
+        state.deadline = getattr(self, deadline_name)
+        state.take = getattr(self, take_name)
+    
+    def _in_backoff(self, state: _ApiState, current_time: int) -> bool:
+        """Check whether the API is currently in exponential backoff"""
+        if state.backoff_until > current_time:
+            self.logger.warning(
+                "API %s in backoff, waiting %.1fs",
+                state.name, (state.backoff_until - current_time) / _NS_PER_SEC
             )
             return True
-        
-        # Calculate time until next token is available
-        wait_time = (1.0 - bucket['tokens']) / bucket['refill_rate']
-        
-        self.logger.warning(
-            f"API {api_name}: No tokens available, next in {wait_time:.1f}s"
-        )
         return False
     
-    async def _fixed_window_check(self, api_name: str, current_time: float) -> bool:
-        """Fixed window rate limit check"""
-        limit = self.limits[api_name]
-        history = self._request_history[api_name]
-        window_start = int(current_time)  # 1-second windows
+    def _compile_sliding_window_check(self, state: _ApiState) -> Callable[[int], bool]:
+        """
+        Build the sliding window check for an API
         
-        # Reset counter if we're in a new window
-        if not history or int(history[-1]) < window_start:
-            history.clear()
+        The limit and history are bound as closure constants, so the returned
+        function does no attribute or dict lookups for them per call. It must
+        be rebuilt whenever the limit or history changes (see update_limits).
+        """
+        name = state.name
+        rps = state.limit.requests_per_second
+        history = state.history
+        append = history.append
+        size = history.maxlen
+        logger = self.logger
+        debug_enabled = logger.isEnabledFor
+        window_size = _NS_PER_SEC  # 1 second window
+        
+        def check(current_time: int) -> bool:
+            # A full history whose oldest entry is still inside the window
+            # means the window is at its limit; otherwise appending evicts
+            # the oldest (expired) entry
+            if len(history) < size or history[0] <= current_time - window_size:
+                append(current_time)
+                if debug_enabled(logging.DEBUG):
+                    logger.debug("API %s: Request allowed (%d/%s)", name, len(history), rps)
+                return True
+            
+            # Report time until next request is allowed
+            logger.warning(
+                "API %s: Rate limited, next request in %.1fs",
+                name, (history[0] + window_size - current_time) / _NS_PER_SEC
+            )
+            return False
         
-        # Check if we're within the limit for this window
-        requests_in_window = sum(1 for t in history if int(t) == window_start)
+        return check
+    
+    def _compile_token_bucket_check(self, state: _ApiState) -> Callable[[int], bool]:
+        """
+        Build the token bucket check for an API
         
-        if requests_in_window < limit.requests_per_second:
-            history.append(current_time)
-            self.logger.debug(
-                f"API {api_name}: Fixed window request allowed ({requests_in_window + 1}/{limit.requests_per_second})"
+        The check is a plain read-modify-write with no await in between, so
+        it is atomic with respect to other tasks on the event loop (it is not
+        thread-safe). All arithmetic is on fixed-point integers, with capacity
+        and refill rate bound as closure constants.
+        """
+        name = state.name
+        bucket = state.bucket
+        burst_capacity = state.limit.burst_capacity
+        capacity = burst_capacity * _TOKEN_SCALE
+        refill_rate = state.limit._refill_rate_fp
+        logger = self.logger
+        debug_enabled = logger.isEnabledFor
+        
+        def check(current_time: int) -> bool:
+            # Builtin min()/max() calls and tuple packing are avoided here:
+            # this is the hottest path in the limiter
+            new_tokens = bucket[0]
+            last_refill = bucket[1]
+            
+            # Refill tokens based on elapsed time
+            if current_time > last_refill:
+                new_tokens += (current_time - last_refill) * refill_rate // _NS_PER_SEC
+                if new_tokens > capacity:
+                    new_tokens = capacity
+                bucket[1] = current_time
+            
+            granted = new_tokens >= _TOKEN_SCALE
+            if granted:
+                new_tokens -= _TOKEN_SCALE
+            bucket[0] = new_tokens
+            
+            # Check if we have tokens available
+            if granted:
+                if debug_enabled(logging.DEBUG):
+                    logger.debug(
+                        "API %s: Token consumed (%.1f/%d remaining)",
+                        name, new_tokens / _TOKEN_SCALE, burst_capacity
+                    )
+                return True
+            
+            # Report time until next token is available
+            logger.warning(
+                "API %s: No tokens available, next in %.1fs",
+                name, (_TOKEN_SCALE - new_tokens) / refill_rate
             )
-            return True
+            return False
         
-        self.logger.warning(
-            f"API {api_name}: Fixed window limit exceeded ({requests_in_window}/{limit.requests_per_second})"
-        )
-        return False
+        return check
+    
+    def _compile_fixed_window_check(self, state: _ApiState) -> Callable[[int], bool]:
+        """Build the fixed window check for an API with its limit bound"""
+        name = state.name
+        rps = state.limit._rps_int
+        logger = self.logger
+        debug_enabled = logger.isEnabledFor
+        
+        def check(current_time: int) -> bool:
+            window_id = current_time // _NS_PER_SEC  # 1-second windows
+            
+            # Reset counter if we're in a new window
+            if window_id != state.window_id:
+                state.window_id = window_id
+                state.window_count = 0
+            
+            # Check if we're within the limit for this window
+            requests_in_window = state.window_count
+            
+            if requests_in_window < rps:
+                state.window_count = requests_in_window + 1
+                if debug_enabled(logging.DEBUG):
+                    logger.debug(
+                        "API %s: Fixed window request allowed (%d/%d)", name, requests_in_window + 1, rps
+                    )
+                return True
+            
+            logger.warning(
+                "API %s: Fixed window limit exceeded (%d/%d)", name, requests_in_window, rps
+            )
+            return False
+        
+        return check
     
-    async def wait_if_needed(self, api_name: str, operation: str = "default") -> float:
+    async def wait_if_needed(self, api_name: str, operation: Optional[str] = None) -> float:
         """
         Wait if necessary and acquire permission
         
         Args:
             api_name: Name of the API
-            operation: Specific operation name
+            operation: Optional operation name, only used in debug logs
             
         Returns:
             float: Time waited in seconds
         """
-        start_time = time.time()
+        state = self._state.get(api_name)
+        if state is None:
+            self.logger.warning("Unknown API name: %s, allowing request", api_name)
+            return 0.0
         
-        while not await self.acquire(api_name, operation):
-            # Calculate optimal wait time based on strategy
-            wait_time = await self._calculate_wait_time(api_name)
+        start_time = monotonic_ns()
+        cond = state.cond
+        
+        while True:
+            async with cond:
+                granted, wake_time = self._try_or_deadline(state, monotonic_ns())
+                
+                wait_ns = wake_time - monotonic_ns()
+                if wait_ns > 0:
+                    self.logger.info("Rate limited for %s, waiting %.1fs", api_name, wait_ns / _NS_PER_SEC)
+                    if operation is not None and self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Waiting operation %s on %s", operation, api_name)
+                
+                # Sleep exactly until the computed deadline instead of polling;
+                # a timer firing slightly early just sleeps for the remainder
+                while wait_ns > 0:
+                    try:
+                        await asyncio.wait_for(cond.wait(), wait_ns / _NS_PER_SEC)
+                    except asyncio.TimeoutError:
+                        wait_ns = wake_time - monotonic_ns()
+                        continue
+                    
+                    # Woken by update_limits: hand a pre-booked token back to
+                    # the (carried-over) bucket and re-check under the new limit
+                    if granted:
+                        self._release_booking(state)
+                        granted = False
+                    break
             
-            self.logger.info(f"Rate limited for {api_name}, waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
+            if granted:
+                break
         
-        total_wait = time.time() - start_time
+        total_wait = (monotonic_ns() - start_time) / _NS_PER_SEC
         if total_wait > 0:
-            self.logger.info(f"Resumed after waiting {total_wait:.1f}s for {api_name}")
+            self.logger.info("Resumed after waiting %.1fs for %s", total_wait, api_name)
         
         return total_wait
     
-    async def _calculate_wait_time(self, api_name: str) -> float:
-        """Calculate optimal wait time for the API"""
-        limit = self.limits[api_name]
-        current_time = time.time()
+    def _try_or_deadline(self, state: _ApiState, current_time: int) -> Tuple[bool, int]:
+        """
+        Try to acquire, otherwise compute when to try again
+        
+        Returns:
+            Tuple[bool, int]: (granted, wake time in monotonic ns). When
+            granted with a future wake time, the request was pre-booked and
+            the caller may proceed once that time is reached without
+            re-checking.
+        """
+        if self._in_backoff(state, current_time):
+            return False, state.backoff_until
         
-        if limit.strategy == RateLimitStrategy.SLIDING_WINDOW:
-            history = self._request_history[api_name]
-            if history:
-                next_available = history[0] + 1.0  # 1-second window
-                return max(0.1, next_available - current_time)
+        check = state.check
+        if check is None:
+            self.logger.warning("Unknown strategy for %s, allowing request", state.name)
+            return True, 0
         
-        elif limit.strategy == RateLimitStrategy.TOKEN_BUCKET:
-            bucket = self._token_buckets[api_name]
-            tokens_needed = 1.0 - bucket['tokens']
-            return max(0.1, tokens_needed / bucket['refill_rate'])
+        if check(current_time):
+            return True, 0
         
-        elif limit.strategy == RateLimitStrategy.FIXED_WINDOW:
-            # Wait until next window
-            return max(0.1, 1.0 - (current_time % 1.0))
+        return state.deadline(state, current_time)
+    
+    def _sliding_window_deadline(self, state: _ApiState, current_time: int) -> Tuple[bool, int]:
+        """Wake up when the oldest request leaves the window"""
+        history = state.history
+        next_available = (history[0] if history else current_time) + _NS_PER_SEC  # 1-second window
+        return False, next_available
+    
+    def _token_bucket_deadline(self, state: _ApiState, current_time: int) -> Tuple[bool, int]:
+        """
+        Pre-book the next token and wake up once it has been refilled
         
-        return 1.0  # Default wait time
+        The bucket is taken into debt by one token, so the caller owns that
+        token when it wakes and concurrent waiters queue up behind it rather
+        than all waking to race for the same refill. A waiter woken early by
+        update_limits gives the token back (_release_booking) and books again
+        against the new limit.
+        """
+        bucket = state.bucket
+        refill_rate = state.limit._refill_rate_fp
+        bucket[0] -= _TOKEN_SCALE
+        debt = -bucket[0]
+        return True, bucket[1] + (debt * _NS_PER_SEC + refill_rate - 1) // refill_rate
+    
+    def _release_booking(self, state: _ApiState) -> None:
+        """Return a token pre-booked by _token_bucket_deadline that was not used"""
+        bucket = state.bucket
+        bucket[0] = min(bucket[0] + _TOKEN_SCALE, state.limit.burst_capacity * _TOKEN_SCALE)
+    
+    def _fixed_window_deadline(self, state: _ApiState, current_time: int) -> Tuple[bool, int]:
+        """Wake up when the next window starts"""
+        return False, (current_time // _NS_PER_SEC + 1) * _NS_PER_SEC
+    
+    def _sliding_window_take(self, state: _ApiState, count: int, current_time: int) -> int:
+        """Admit up to `count` requests into the sliding window at once"""
+        history = state.history
+        expired = bisect.bisect_right(history, current_time - _NS_PER_SEC)
+        granted = min(count, history.maxlen - len(history) + expired)
+        history.extend([current_time] * granted)
+        return granted
+    
+    def _token_bucket_take(self, state: _ApiState, count: int, current_time: int) -> int:
+        """Consume up to `count` whole tokens at once"""
+        bucket = state.bucket
+        limit = state.limit
+        capacity = limit.burst_capacity * _TOKEN_SCALE
+        refill_rate = limit._refill_rate_fp
+        
+        tokens, last_refill = bucket
+        elapsed = max(0, current_time - last_refill)
+        available = min(capacity, tokens + elapsed * refill_rate // _NS_PER_SEC)
+        granted = max(0, min(count, available // _TOKEN_SCALE))
+        
+        bucket[0] = available - granted * _TOKEN_SCALE
+        bucket[1] = max(current_time, last_refill)
+        return granted
+    
+    def _fixed_window_take(self, state: _ApiState, count: int, current_time: int) -> int:
+        """Admit up to `count` requests into the current fixed window at once"""
+        window_id = current_time // _NS_PER_SEC
+        if window_id != state.window_id:
+            state.window_id = window_id
+            state.window_count = 0
+        
+        capacity = state.limit._rps_int
+        granted = max(0, min(count, capacity - state.window_count))
+        state.window_count += granted
+        return granted
     
     def trigger_backoff(self, api_name: str, error_code: Optional[int] = None) -> None:
         """
@@ -268,21 +634,20 @@ class RateLimiter:
             api_name: Name of the API
             error_code: HTTP error code that triggered backoff
         """
-        if api_name not in self.limits:
+        state = self._state.get(api_name)
+        if state is None:
             return
         
-        limit = self.limits[api_name]
-        current_delay = self._backoff_delays.get(f"{api_name}_base", 1.0)
-        
+        limit = state.limit
         # Calculate new backoff delay
         new_delay = min(
-            current_delay * limit.backoff_base,
+            state.backoff_delay * limit.backoff_base,
             limit.backoff_max
         )
         
         # Set backoff expiry time
-        self._backoff_delays[api_name] = time.time() + new_delay
-        self._backoff_delays[f"{api_name}_base"] = new_delay
+        state.backoff_until = monotonic_ns() + int(new_delay * _NS_PER_SEC)
+        state.backoff_delay = new_delay
         
         self.logger.warning(
             f"Triggered backoff for {api_name}: {new_delay:.1f}s "
@@ -291,8 +656,10 @@ class RateLimiter:
     
     def reset_backoff(self, api_name: str) -> None:
         """Reset backoff state for an API"""
-        self._backoff_delays.pop(api_name, None)
-        self._backoff_delays.pop(f"{api_name}_base", None)
+        state = self._state.get(api_name)
+        if state is not None:
+            state.backoff_until = 0
+            state.backoff_delay = 1.0
         self.logger.info(f"Reset backoff for {api_name}")
     
     def get_status(self, api_name: Optional[str] = None) -> Dict[str, Any]:
@@ -305,50 +672,44 @@ class RateLimiter:
         Returns:
             Dict containing rate limiting status information
         """
-        current_time = time.time()
+        current_time = monotonic_ns()
         
         if api_name:
-            apis_to_check = [api_name] if api_name in self.limits else []
+            states = [self._state[api_name]] if api_name in self._state else []
         else:
-            apis_to_check = list(self.limits.keys())
+            states = list(self._state.values())
         
         status = {}
         
-        for api in apis_to_check:
-            limit = self.limits[api]
-            history = self._request_history[api]
+        for state in states:
+            limit = state.limit
             
-            # Calculate current usage
-            window_requests = 0
-            if limit.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                cutoff = current_time - 1.0
-                window_requests = sum(1 for t in history if t > cutoff)
+            # Current usage as maintained by the acquire path
+            window_requests = state.window_requests(current_time)
             
             # Get token bucket status
-            bucket_status = None
-            if api in self._token_buckets:
-                bucket = self._token_buckets[api]
-                elapsed = current_time - bucket['last_refill']
-                current_tokens = min(
-                    bucket['capacity'],
-                    bucket['tokens'] + elapsed * bucket['refill_rate']
-                )
-                bucket_status = {
-                    'tokens': current_tokens,
-                    'capacity': bucket['capacity'],
-                    'refill_rate': bucket['refill_rate']
-                }
+            tokens, last_refill = state.bucket
+            elapsed = max(0, current_time - last_refill)
+            current_tokens = min(
+                limit.burst_capacity * _TOKEN_SCALE,
+                tokens + elapsed * limit._refill_rate_fp // _NS_PER_SEC
+            )
+            bucket_status = {
+                'tokens': max(0, current_tokens) / _TOKEN_SCALE,
+                'capacity': limit.burst_capacity,
+                'refill_rate': limit.requests_per_second
+            }
             
             # Check backoff status
-            backoff_remaining = max(0, self._backoff_delays.get(api, 0) - current_time)
+            backoff_remaining = max(0, state.backoff_until - current_time) / _NS_PER_SEC
             
-            status[api] = {
+            status[state.name] = {
                 'strategy': limit.strategy.value,
                 'requests_per_second': limit.requests_per_second,
                 'current_window_requests': window_requests,
                 'bucket_status': bucket_status,
                 'backoff_remaining': backoff_remaining,
-                'is_rate_limited': backoff_remaining > 0 or window_requests >= limit.requests_per_second
+                'is_rate_limited': backoff_remaining > 0 or window_requests >= limit._rps_int
             }
         
         return status
@@ -369,16 +730,25 @@ class RateLimiter:
         results = {}
         
         for api_name, count in requests.items():
-            api_results = []
-            for i in range(count):
-                result = await self.acquire(api_name, f"bulk_{i}")
-                api_results.append(result)
-                
-                # If rate limited, don't continue acquiring
-                if not result:
-                    break
+            state = self._state.get(api_name)
+            if state is None:
+                self.logger.warning("Unknown API name: %s, allowing request", api_name)
+                results[api_name] = True
+                continue
+            
+            if count <= 0:
+                results[api_name] = True
+                continue
             
-            results[api_name] = all(api_results)
+            # Decide the whole batch under a single lock acquisition; like the
+            # one-by-one path, requests granted before the limit is hit are kept
+            if state.needs_lock:
+                async with state.cond:
+                    granted = self._try_acquire_n(state, count, monotonic_ns())
+            else:
+                granted = self._try_acquire_n(state, count, monotonic_ns())
+            
+            results[api_name] = granted == count
         
         return results
     
@@ -394,17 +764,37 @@ class RateLimiter:
             bool: True if successfully updated
         """
         if api_name in self.limits:
+            state = self._state[api_name]
             old_limit = self.limits[api_name]
             self.limits[api_name] = new_limit
+            state.limit = new_limit
             
-            # Update token bucket if strategy changed
+            # Resize the sliding window history, keeping the latest entries
+            state.init_history(state.history)
+            
+            # Update token bucket if strategy changed; tokens pre-booked by
+            # sleeping waiters stay owed, so a bucket in debt keeps its debt
             if new_limit.strategy == RateLimitStrategy.TOKEN_BUCKET:
-                self._token_buckets[api_name] = {
-                    'tokens': new_limit.burst_capacity,
-                    'capacity': new_limit.burst_capacity,
-                    'refill_rate': new_limit.requests_per_second,
-                    'last_refill': time.time()
-                }
+                current_time = monotonic_ns()
+                tokens, last_refill = state.bucket
+                tokens += max(0, current_time - last_refill) * old_limit._refill_rate_fp // _NS_PER_SEC
+                state.bucket = [
+                    tokens if tokens < 0 else new_limit.burst_capacity * _TOKEN_SCALE,
+                    current_time
+                ]
+            
+            # Rebuild the specialized check for the new limit
+            self._bind_strategy(state)
+            
+            # Wake waiters so they re-check against the new limit right away
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None  # No event loop, so nobody can be waiting
+            if loop is not None:
+                task = loop.create_task(self._notify_limit_change(state))
+                self._notify_tasks.add(task)
+                task.add_done_callback(self._notify_tasks.discard)
             
             self.logger.info(
                 f"Updated rate limit for {api_name}: "
@@ -413,6 +803,11 @@ class RateLimiter:
             return True
         
         return False
+    
+    async def _notify_limit_change(self, state: _ApiState) -> None:
+        """Wake every wait_if_needed caller sleeping on the API"""
+        async with state.cond:
+            state.cond.notify_all()
 
 
 class APIRateLimitDecorator:
@@ -435,13 +830,11 @@ class APIRateLimitDecorator:
         """Apply rate limiting to the decorated function"""
         
         async def wrapper(*args, **kwargs) -> Any:
-            operation_name = kwargs.pop('_rate_limit_operation', func.__name__)
+            # Strip the legacy per-call operation override before forwarding
+            kwargs.pop('_rate_limit_operation', None)
             
             # Wait for rate limit permission
-            wait_time = await self.rate_limiter.wait_if_needed(
-                self.api_name, 
-                operation_name
-            )
+            wait_time = await self.rate_limiter.wait_if_needed(self.api_name)
             
             try:
                 # Execute the function
@@ -8,18 +8,215 @@
 """
 
 import os
+import re
+import ast
 import sys
 import json
 import yaml
 import shutil
+import string
+import hashlib
+import queue
 import asyncio
+import logging
+import logging.handlers
 import concurrent.futures
+from collections import Counter, defaultdict
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from datetime import datetime
 
-@dataclass
+# LibYAML がある場合は C 実装のローダー/ダンパーを使用
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# orjson がある場合は JSON の読み書きに使用（未導入なら標準 json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 解析用正規表現（モジュール読み込み時に一度だけコンパイル）
+_TABLE_RE = re.compile(r'\|\s*(\S+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|')
+
+# エージェントID正規化用の変換表（英大文字→小文字、'_'→'-' を一度に変換）
+_AGENT_ID_TABLE = str.maketrans(string.ascii_uppercase + '_', string.ascii_lowercase + '-')
+
+# エージェントIDのキーワード→優先度（値は昇順、先に一致したキーほど優先）
+_PRIORITY_MAP = {
+    'cto': 1,
+    'manager': 1,
+    'dev': 2,
+    'qa': 2,
+    'security': 2,
+    'frontend': 3,
+    'backend': 3,
+    'devops': 3,
+    'performance': 3,
+    'nlp': 3
+}
+# 先読みで重なり合うキーワード (例: 'backendev') も全て拾う。同じ位置で
+# 複数一致する場合は優先度の高いキーワードが選ばれるよう並べておく
+_PRIORITY_RE = re.compile(
+    '(?=(%s))' % '|'.join(map(re.escape, sorted(_PRIORITY_MAP, key=_PRIORITY_MAP.get)))
+)
+
+# 役割のキーワード→(判定順, カテゴリ)
+_CATEGORY_MAP = {
+    'cto': (0, 'leadership'),
+    '戦略': (0, 'leadership'),
+    'dev': (1, 'development'),
+    '開発': (1, 'development'),
+    'qa': (2, 'quality'),
+    'test': (2, 'quality'),
+    'manager': (3, 'management'),
+    '管理': (3, 'management')
+}
+# _PRIORITY_RE と同様、重なりを拾い同じ位置では判定順の早いものを選ぶ
+_CATEGORY_RE = re.compile(
+    '(?=(%s))' % '|'.join(map(re.escape, sorted(_CATEGORY_MAP, key=_CATEGORY_MAP.get)))
+)
+
+# 正規化済み Python 設定ファイルのテンプレート
+_PYTHON_CONFIG_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""
+正規化されたエージェント設定
+自動生成日時: ${generated_at}
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+# 正規化されたエージェント定義
+AGENTS = ${agents}
+
+# 以下、既存のクラス定義を維持
+class AgentPromptManager:
+    # 既存の実装を保持
+    pass
+
+if __name__ == "__main__":
+    main()
+''')
+
+
+def _slurp(path: Path) -> bytes:
+    """ファイル全体を読み込み（バッファ付きIO層を介さず fstat のサイズで os.read）"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # 通常ファイルでは一度で読み切れるが、短い読み込みに備えて残りを取得
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+async def _read_text(path: Path) -> str:
+    """ファイル読み込み（スレッドにオフロード）"""
+    return (await asyncio.to_thread(_slurp, path)).decode('utf-8')
+
+
+def _load_yaml_sync(path: Path):
+    """YAML読み込み＋解析（ワーカースレッドで一括実行）"""
+    return yaml.load(_slurp(path).decode('utf-8'), Loader=_YamlLoader)
+
+
+def _load_json_sync(path: Path):
+    """JSON読み込み＋解析（ワーカースレッドで一括実行）"""
+    if orjson is not None:
+        return orjson.loads(_slurp(path))
+    return json.loads(_slurp(path).decode('utf-8'))
+
+
+def _backup_sync(source: Path, backup_path: Path) -> None:
+    """バックアップ作成（元ファイルと inode を共有しない独立したコピー）"""
+    shutil.copy2(source, backup_path)
+
+
+def _restore_sync(backup_path: Path, original_path: Path) -> None:
+    """バックアップから復元"""
+    shutil.copy2(backup_path, original_path)
+
+
+def _fingerprint_sync(paths: Dict[str, Path]) -> Dict[str, str]:
+    """ファイルの内容ハッシュ一覧（存在しないファイルは含めない）"""
+    return {
+        file_type: hashlib.blake2b(_slurp(path), digest_size=16).hexdigest()
+        for file_type, path in paths.items()
+        if path.exists()
+    }
+
+
+def _load_manifest_sync(path: Path) -> Optional[Dict[str, Dict[str, str]]]:
+    """前回実行時のマニフェスト読み込み（存在しない/壊れている場合は None）"""
+    try:
+        return _load_json_sync(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """進捗ログをキュー経由で別スレッドから出力（イベントループを端末IOで止めない）"""
+    log_queue = queue.SimpleQueue()
+    # QueueHandler 側で整形済みメッセージになるため、出力側は既定の '%(message)s' のまま
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+
+def _json_text(data) -> str:
+    """JSON文字列化（orjson があれば C 実装、インデント幅はどちらも2）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _emit_bytes_sync(path: Path, data: bytes) -> None:
+    """ファイル書き込み（既存ファイルと同一内容なら書き込まない）"""
+    try:
+        # サイズが違えば中身を読むまでもなく変更あり
+        if path.stat().st_size == len(data) and _slurp(path) == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+def _emit_text_sync(path: Path, content: str) -> None:
+    """テキスト書き込み（ワーカースレッドで一括実行）"""
+    _emit_bytes_sync(path, content.encode('utf-8'))
+
+
+def _emit_yaml_sync(path: Path, data) -> None:
+    """YAMLシリアライズ＋書き込み（ワーカースレッドで一括実行）"""
+    _emit_text_sync(path, yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True, indent=2))
+
+
+def _emit_json_sync(path: Path, data) -> None:
+    """JSONシリアライズ＋書き込み（ワーカースレッドで一括実行）"""
+    if orjson is not None:
+        _emit_bytes_sync(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    _emit_text_sync(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """統一されたエージェント設定データクラス"""
     id: str
@@ -34,15 +231,31 @@ class AgentConfig:
     
     def __post_init__(self):
         if self.dependencies is None:
-            self.dependencies = []
+            object.__setattr__(self, 'dependencies', [])
+    
+    def to_dict(self) -> Dict:
+        """出力用の辞書に変換（asdict の再帰コピーを避けた固定フィールド版）"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'role': self.role,
+            'goal': self.goal,
+            'category': self.category,
+            'priority': self.priority,
+            'status': self.status,
+            'color': self.color,
+            'dependencies': list(self.dependencies)
+        }
 
 class AgentConfigBatchFixer:
     """エージェント設定バッチ修正クラス"""
     
     def __init__(self, base_dir: str = "/mnt/Linux-ExHDD/PersonalCookingRecipe"):
         self.base_dir = Path(base_dir)
+        self.logger = logging.getLogger(__name__)
         self.backup_dir = self.base_dir / "backups" / f"agent-config-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.agents: Dict[str, AgentConfig] = {}
+        self._agent_dicts: List[Dict] = []
         self.config_files = {
             "yaml": self.base_dir / "docs" / "agents.yaml",
             "python": self.base_dir / "scripts" / "agent-selector.py",
@@ -50,17 +263,36 @@ class AgentConfigBatchFixer:
             "matrix": self.base_dir / "management" / "agent-coordination-matrix.md",
             "claude_config": self.base_dir / "claude-flow.config.json"
         }
+        self.output_files = {
+            "yaml": self.base_dir / "config" / "agents-normalized.yaml",
+            "python": self.base_dir / "config" / "agent-selector-normalized.py",
+            "shell": self.base_dir / "config" / "claude-agent-prompt-normalized.sh",
+            "matrix": self.base_dir / "config" / "agent-coordination-matrix-normalized.md",
+            "claude_config": self.base_dir / "config" / "claude-flow-normalized.json"
+        }
+        self.manifest_path = self.base_dir / "config" / ".manifest.json"
     
     async def execute_batch_fix(self) -> bool:
         """並列バッチ修正の実行"""
         try:
-            print("🚀 エージェント設定バッチ修正開始")
+            self.logger.info("🚀 エージェント設定バッチ修正開始")
             
-            # 1. バックアップ作成（並列）
-            await self._create_backup()
+            # 0. 入力・出力とも前回成功時から変わっていなければ何もしない
+            #    （出力が削除/変更されていれば再生成する）
+            fingerprint, outputs, manifest = await asyncio.gather(
+                asyncio.to_thread(_fingerprint_sync, self.config_files),
+                asyncio.to_thread(_fingerprint_sync, self.output_files),
+                asyncio.to_thread(_load_manifest_sync, self.manifest_path)
+            )
+            if manifest == {'inputs': fingerprint, 'outputs': outputs}:
+                self.logger.info("✅ 設定ファイルに変更なし - バッチ修正をスキップ")
+                return True
             
-            # 2. 設定ファイル解析（並列）
-            await self._analyze_config_files()
+            # 1. バックアップ作成 / 2. 設定ファイル解析（並列）
+            # 解析は元ファイルを読むだけで、バックアップも元ファイルを変更しないため同時に実行可能
+            backup_task = asyncio.create_task(self._create_backup())
+            analyze_task = asyncio.create_task(self._analyze_config_files())
+            await asyncio.gather(backup_task, analyze_task)
             
             # 3. エージェント統合（並列）
             await self._normalize_agent_configs()
@@ -72,21 +304,24 @@ class AgentConfigBatchFixer:
             validation_result = await self._validate_corrections()
             
             if validation_result:
-                print("✅ バッチ修正完了")
+                outputs = await asyncio.to_thread(_fingerprint_sync, self.output_files)
+                manifest = {'inputs': fingerprint, 'outputs': outputs}
+                await asyncio.to_thread(_emit_text_sync, self.manifest_path, _json_text(manifest))
+                self.logger.info("✅ バッチ修正完了")
                 return True
             else:
-                print("❌ 検証失敗 - ロールバック実行")
+                self.logger.error("❌ 検証失敗 - ロールバック実行")
                 await self._rollback()
                 return False
                 
         except Exception as e:
-            print(f"❌ バッチ修正エラー: {e}")
+            self.logger.error(f"❌ バッチ修正エラー: {e}")
             await self._rollback()
             return False
     
     async def _create_backup(self):
         """設定ファイルバックアップ（並列処理）"""
-        print("📦 バックアップ作成中...")
+        self.logger.info("📦 バックアップ作成中...")
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
         backup_tasks = []
@@ -96,16 +331,16 @@ class AgentConfigBatchFixer:
                 backup_tasks.append(task)
         
         await asyncio.gather(*backup_tasks)
-        print(f"✅ バックアップ完了: {self.backup_dir}")
+        self.logger.info(f"✅ バックアップ完了: {self.backup_dir}")
     
     async def _backup_file(self, source: Path, file_type: str):
         """個別ファイルバックアップ"""
         backup_path = self.backup_dir / f"{file_type}_{source.name}"
-        shutil.copy2(source, backup_path)
+        await asyncio.to_thread(_backup_sync, source, backup_path)
     
     async def _analyze_config_files(self):
         """設定ファイル解析（並列処理）"""
-        print("🔍 設定ファイル解析中...")
+        self.logger.info("🔍 設定ファイル解析中...")
         
         analysis_tasks = []
         for file_type, file_path in self.config_files.items():
@@ -115,17 +350,18 @@ class AgentConfigBatchFixer:
         
         results = await asyncio.gather(*analysis_tasks)
         
-        # 結果を統合
+        # 結果を統合（ID ごとに候補を集めてから一度だけマージ）
+        candidates: Dict[str, List[AgentConfig]] = defaultdict(list)
         for result in results:
             if result:
                 for agent_id, agent_config in result.items():
-                    if agent_id in self.agents:
-                        # 既存設定とマージ
-                        self.agents[agent_id] = self._merge_agent_configs(
-                            self.agents[agent_id], agent_config
-                        )
-                    else:
-                        self.agents[agent_id] = agent_config
+                    candidates[agent_id].append(agent_config)
+        
+        for agent_id, configs in candidates.items():
+            if len(configs) == 1:
+                self.agents[agent_id] = configs[0]
+            else:
+                self.agents[agent_id] = self._reduce_agent_configs(configs)
     
     async def _analyze_single_file(self, file_path: Path, file_type: str) -> Optional[Dict[str, AgentConfig]]:
         """個別ファイル解析"""
@@ -138,13 +374,12 @@ class AgentConfigBatchFixer:
                 return await self._parse_matrix_config(file_path)
             return None
         except Exception as e:
-            print(f"⚠️ {file_path} 解析エラー: {e}")
+            self.logger.warning(f"⚠️ {file_path} 解析エラー: {e}")
             return None
     
     async def _parse_yaml_config(self, file_path: Path) -> Dict[str, AgentConfig]:
         """YAML設定解析"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = await asyncio.to_thread(_load_yaml_sync, file_path)
         
         agents = {}
         if 'agents' in data:
@@ -164,39 +399,38 @@ class AgentConfigBatchFixer:
     async def _parse_python_config(self, file_path: Path) -> Dict[str, AgentConfig]:
         """Python設定解析"""
         agents = {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # AGENTS辞書を抽出
-        import re
-        agents_match = re.search(r'AGENTS\s*=\s*{(.*?)}', content, re.DOTALL)
-        if agents_match:
-            agents_str = agents_match.group(1)
-            # 簡易解析（本格的には ast モジュールを使用）
-            for line in agents_str.split('\n'):
-                if '"recipe-' in line and ':' in line:
-                    agent_id = line.split('"')[1]
-                    agent = AgentConfig(
-                        id=agent_id,
-                        name=f"Agent {agent_id.replace('-', ' ').title()}",
-                        role="Role extracted from Python",
-                        goal="Goal extracted from Python",
-                        category="legacy",
-                        priority=3
-                    )
-                    agents[agent_id] = agent
+        content = await _read_text(file_path)
+        
+        # AGENTS辞書を抽出（ast で代入文を探し、値をリテラル評価）
+        for node in ast.parse(content, filename=str(file_path)).body:
+            if not (isinstance(node, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == 'AGENTS' for t in node.targets)):
+                continue
+            
+            data = ast.literal_eval(node.value)
+            for agent_id, agent_info in data.items():
+                if 'recipe-' not in agent_id:
+                    continue
+                agent = AgentConfig(
+                    id=agent_id,
+                    name=agent_info.get('name', f"Agent {agent_id.replace('-', ' ').title()}"),
+                    role=agent_info.get('role', "Role extracted from Python"),
+                    goal="Goal extracted from Python",
+                    category="legacy",
+                    priority=3
+                )
+                agents[agent_id] = agent
+            break
         
         return agents
     
     async def _parse_matrix_config(self, file_path: Path) -> Dict[str, AgentConfig]:
         """Matrix設定解析"""
         agents = {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = await _read_text(file_path)
         
         # テーブルからエージェント情報を抽出
-        import re
-        table_matches = re.findall(r'\|\s*(\S+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|', content)
+        table_matches = _TABLE_RE.findall(content)
         
         for match in table_matches:
             agent_id, name, role = match
@@ -229,50 +463,46 @@ class AgentConfigBatchFixer:
         )
         return merged
     
+    def _reduce_agent_configs(self, configs: List[AgentConfig]) -> AgentConfig:
+        """複数候補の一括マージ（_merge_agent_configs を順に適用した結果と同じ）"""
+        first = configs[0]
+        # min は同順位なら先頭を返すため、逐次マージと同じ候補が選ばれる
+        best = min(configs, key=lambda c: c.priority)
+        return AgentConfig(
+            id=first.id,
+            name=best.name,
+            role=best.role,
+            goal=best.goal,
+            category=first.category,
+            priority=best.priority,
+            status=first.status,
+            color=first.color,
+            dependencies=list(set().union(*(c.dependencies for c in configs)))
+        )
+    
     def _determine_category(self, role: str) -> str:
         """役割からカテゴリ決定"""
-        role_lower = role.lower()
-        if 'cto' in role_lower or '戦略' in role_lower:
-            return 'leadership'
-        elif 'dev' in role_lower or '開発' in role_lower:
-            return 'development'
-        elif 'qa' in role_lower or 'test' in role_lower:
-            return 'quality'
-        elif 'manager' in role_lower or '管理' in role_lower:
-            return 'management'
-        else:
+        # 一度の走査で全キーワードを拾い、判定順が最も早いカテゴリを採用
+        hits = _CATEGORY_RE.findall(role.lower())
+        if not hits:
             return 'specialized'
+        return min(_CATEGORY_MAP[hit] for hit in hits)[1]
     
     def _calculate_priority(self, agent_id: str) -> int:
         """エージェントIDから優先度計算"""
-        priority_map = {
-            'cto': 1,
-            'manager': 1,
-            'dev': 2,
-            'qa': 2,
-            'security': 2,
-            'frontend': 3,
-            'backend': 3,
-            'devops': 3,
-            'performance': 3,
-            'nlp': 3
-        }
-        
-        for key, priority in priority_map.items():
-            if key in agent_id.lower():
-                return priority
-        return 4
+        return min(map(_PRIORITY_MAP.__getitem__, _PRIORITY_RE.findall(agent_id.lower())), default=4)
     
     async def _normalize_agent_configs(self):
         """エージェント設定正規化"""
-        print("🔧 エージェント設定正規化中...")
+        self.logger.info("🔧 エージェント設定正規化中...")
         
         # 重複除去
         unique_agents = {}
         for agent_id, agent in self.agents.items():
             normalized_id = self._normalize_agent_id(agent_id)
             if normalized_id not in unique_agents:
-                agent.id = normalized_id
+                if agent.id != normalized_id:
+                    agent = replace(agent, id=normalized_id)
                 unique_agents[normalized_id] = agent
             else:
                 # マージ
@@ -281,18 +511,23 @@ class AgentConfigBatchFixer:
                 )
         
         self.agents = unique_agents
-        print(f"✅ {len(self.agents)} エージェントを正規化")
+        self.logger.info(f"✅ {len(self.agents)} エージェントを正規化")
     
     def _normalize_agent_id(self, agent_id: str) -> str:
         """エージェントID正規化"""
         # "Recipe-cto" -> "recipe-cto"
         # "recipe_dev" -> "recipe-dev"
-        normalized = agent_id.lower().replace('_', '-').replace('recipe-', '').strip('-')
-        return f"recipe-{normalized}"
+        return 'recipe-' + agent_id.translate(_AGENT_ID_TABLE).replace('recipe-', '').strip('-')
     
     async def _generate_corrected_files(self):
         """修正済みファイル生成（並列）"""
-        print("📝 修正済みファイル生成中...")
+        self.logger.info("📝 修正済みファイル生成中...")
+        
+        # 出力先ディレクトリは各生成タスクではなくここで一度だけ作成
+        (self.base_dir / "config").mkdir(parents=True, exist_ok=True)
+        
+        # YAML/JSON 生成で共有する辞書を一度だけ作成
+        self._agent_dicts = [agent.to_dict() for agent in self.agents.values()]
         
         generation_tasks = [
             asyncio.create_task(self._generate_yaml_config()),
@@ -303,12 +538,12 @@ class AgentConfigBatchFixer:
         ]
         
         await asyncio.gather(*generation_tasks)
-        print("✅ 修正済みファイル生成完了")
+        self.logger.info("✅ 修正済みファイル生成完了")
     
     async def _generate_yaml_config(self):
         """YAML設定ファイル生成"""
         config_data = {
-            'agents': [asdict(agent) for agent in self.agents.values()],
+            'agents': self._agent_dicts,
             'execution': {
                 'max_iterations': 4,
                 'no_context': True,
@@ -321,11 +556,8 @@ class AgentConfigBatchFixer:
             }
         }
         
-        output_path = self.base_dir / "config" / "agents-normalized.yaml"
-        output_path.parent.mkdir(exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True, indent=2)
+        output_path = self.output_files["yaml"]
+        await asyncio.to_thread(_emit_yaml_sync, output_path, config_data)
     
     async def _generate_python_config(self):
         """Python設定ファイル生成"""
@@ -337,32 +569,13 @@ class AgentConfigBatchFixer:
                 'color': agent.color
             }
         
-        python_content = f'''#!/usr/bin/env python3
-"""
-正規化されたエージェント設定
-自動生成日時: {datetime.now().isoformat()}
-"""
-
-import os
-import sys
-import json
-from pathlib import Path
-
-# 正規化されたエージェント定義
-AGENTS = {json.dumps(agents_dict, indent=4, ensure_ascii=False)}
-
-# 以下、既存のクラス定義を維持
-class AgentPromptManager:
-    # 既存の実装を保持
-    pass
-
-if __name__ == "__main__":
-    main()
-'''
+        python_content = _PYTHON_CONFIG_TEMPLATE.substitute(
+            generated_at=datetime.now().isoformat(),
+            agents=json.dumps(agents_dict, indent=4, ensure_ascii=False)
+        )
         
-        output_path = self.base_dir / "config" / "agent-selector-normalized.py"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(python_content)
+        output_path = self.output_files["python"]
+        await asyncio.to_thread(_emit_text_sync, output_path, python_content)
     
     async def _generate_shell_config(self):
         """Shell設定ファイル生成"""
@@ -384,13 +597,12 @@ CLAUDE_RESET_COLOR="\\033[0m"
 # 既存の関数定義を保持
 '''
         
-        output_path = self.base_dir / "config" / "claude-agent-prompt-normalized.sh"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(shell_content)
+        output_path = self.output_files["shell"]
+        await asyncio.to_thread(_emit_text_sync, output_path, shell_content)
     
     async def _generate_matrix_config(self):
         """マトリクス設定ファイル生成"""
-        matrix_content = f'''# 正規化されたエージェント調整マトリクス
+        header = f'''# 正規化されたエージェント調整マトリクス
 # 自動生成日時: {datetime.now().isoformat()}
 
 ## エージェント構成
@@ -399,18 +611,20 @@ CLAUDE_RESET_COLOR="\\033[0m"
 |----------|------|------|----------|----------|--------|
 '''
         
-        for agent in sorted(self.agents.values(), key=lambda x: x.priority):
-            status_emoji = "🟢" if agent.status == "active" else "🟡"
-            matrix_content += f"| {agent.id} | {agent.name} | {agent.role} | {agent.category} | {agent.priority} | {status_emoji} |\n"
+        rows = [
+            f"| {agent.id} | {agent.name} | {agent.role} | {agent.category} | {agent.priority} | "
+            f"{'🟢' if agent.status == 'active' else '🟡'} |\n"
+            for agent in sorted(self.agents.values(), key=attrgetter('priority'))
+        ]
+        matrix_content = header + ''.join(rows)
         
-        output_path = self.base_dir / "config" / "agent-coordination-matrix-normalized.md"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(matrix_content)
+        output_path = self.output_files["matrix"]
+        await asyncio.to_thread(_emit_text_sync, output_path, matrix_content)
     
     async def _generate_json_config(self):
         """JSON設定ファイル生成"""
         config_data = {
-            'agents': {agent.id: asdict(agent) for agent in self.agents.values()},
+            'agents': {agent_dict['id']: agent_dict for agent_dict in self._agent_dicts},
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'total_agents': len(self.agents),
@@ -436,64 +650,66 @@ CLAUDE_RESET_COLOR="\\033[0m"
             }
         }
         
-        output_path = self.base_dir / "config" / "claude-flow-normalized.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        output_path = self.output_files["claude_config"]
+        await asyncio.to_thread(_emit_json_sync, output_path, config_data)
     
     async def _validate_corrections(self) -> bool:
         """修正結果検証"""
-        print("🔍 修正結果検証中...")
+        self.logger.info("🔍 修正結果検証中...")
         
-        validation_tasks = [
-            asyncio.create_task(self._validate_file_syntax()),
-            asyncio.create_task(self._validate_agent_consistency()),
-            asyncio.create_task(self._validate_dependencies())
-        ]
+        # 構文チェックはワーカースレッド、整合性/依存関係チェックはイベントループで並行実行
+        async with asyncio.TaskGroup() as tg:
+            validation_tasks = [
+                tg.create_task(self._validate_file_syntax()),
+                tg.create_task(self._validate_agent_consistency()),
+                tg.create_task(self._validate_dependencies())
+            ]
         
-        results = await asyncio.gather(*validation_tasks)
-        return all(results)
+        return all(task.result() for task in validation_tasks)
     
     async def _validate_file_syntax(self) -> bool:
         """ファイル構文検証"""
         try:
+            syntax_checks = []
+            
             # YAML構文チェック
-            yaml_path = self.base_dir / "config" / "agents-normalized.yaml"
+            yaml_path = self.output_files["yaml"]
             if yaml_path.exists():
-                with open(yaml_path, 'r', encoding='utf-8') as f:
-                    yaml.safe_load(f)
+                syntax_checks.append(asyncio.to_thread(_load_yaml_sync, yaml_path))
             
             # JSON構文チェック
-            json_path = self.base_dir / "config" / "claude-flow-normalized.json"
+            json_path = self.output_files["claude_config"]
             if json_path.exists():
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                syntax_checks.append(asyncio.to_thread(_load_json_sync, json_path))
+            
+            await asyncio.gather(*syntax_checks)
             
-            print("✅ ファイル構文検証完了")
+            self.logger.info("✅ ファイル構文検証完了")
             return True
         except Exception as e:
-            print(f"❌ ファイル構文エラー: {e}")
+            self.logger.error(f"❌ ファイル構文エラー: {e}")
             return False
     
     async def _validate_agent_consistency(self) -> bool:
         """エージェント整合性検証"""
-        try:
-            # 重複ID検証
-            agent_ids = [agent.id for agent in self.agents.values()]
-            if len(agent_ids) != len(set(agent_ids)):
-                print("❌ エージェントID重複検出")
-                return False
-            
-            # 必須フィールド検証
-            for agent in self.agents.values():
-                if not all([agent.id, agent.name, agent.role]):
-                    print(f"❌ エージェント {agent.id} 必須フィールド不足")
-                    return False
-            
-            print("✅ エージェント整合性検証完了")
-            return True
-        except Exception as e:
-            print(f"❌ エージェント整合性エラー: {e}")
+        # 重複ID検証
+        id_counts = Counter(agent.id for agent in self.agents.values())
+        duplicates = [agent_id for agent_id, count in id_counts.items() if count > 1]
+        if duplicates:
+            self.logger.error(f"❌ エージェントID重複検出: {duplicates}")
             return False
+        
+        # 必須フィールド検証（最初の不足で打ち切り）
+        invalid = next(
+            (agent for agent in self.agents.values() if not (agent.id and agent.name and agent.role)),
+            None
+        )
+        if invalid is not None:
+            self.logger.error(f"❌ エージェント {invalid.id} 必須フィールド不足")
+            return False
+        
+        self.logger.info("✅ エージェント整合性検証完了")
+        return True
     
     async def _validate_dependencies(self) -> bool:
         """依存関係検証"""
@@ -503,37 +719,47 @@ CLAUDE_RESET_COLOR="\\033[0m"
             for agent in self.agents.values():
                 for dep in agent.dependencies:
                     if dep not in agent_ids:
-                        print(f"❌ エージェント {agent.id} の依存関係 {dep} が見つからない")
+                        self.logger.error(f"❌ エージェント {agent.id} の依存関係 {dep} が見つからない")
                         return False
             
-            print("✅ 依存関係検証完了")
+            self.logger.info("✅ 依存関係検証完了")
             return True
         except Exception as e:
-            print(f"❌ 依存関係エラー: {e}")
+            self.logger.error(f"❌ 依存関係エラー: {e}")
             return False
     
     async def _rollback(self):
         """ロールバック実行"""
-        print("🔄 ロールバック実行中...")
+        self.logger.info("🔄 ロールバック実行中...")
         
+        restore_tasks = []
         for file_type, original_path in self.config_files.items():
             backup_path = self.backup_dir / f"{file_type}_{original_path.name}"
             if backup_path.exists():
-                shutil.copy2(backup_path, original_path)
+                restore_tasks.append(asyncio.to_thread(_restore_sync, backup_path, original_path))
         
-        print("✅ ロールバック完了")
+        await asyncio.gather(*restore_tasks)
+        
+        self.logger.info("✅ ロールバック完了")
 
 async def main():
     """メイン実行関数"""
-    fixer = AgentConfigBatchFixer()
-    success = await fixer.execute_batch_fix()
+    listener = _start_log_listener()
+    try:
+        fixer = AgentConfigBatchFixer()
+        success = await fixer.execute_batch_fix()
+        
+        if success:
+            fixer.logger.info("\n🎉 エージェント設定バッチ修正完了")
+            fixer.logger.info("📁 修正済みファイル: config/")
+            fixer.logger.info("📦 バックアップ: backups/")
+        else:
+            fixer.logger.error("\n❌ バッチ修正失敗")
+    finally:
+        # キューに残ったログを出し切ってから終了
+        listener.stop()
     
-    if success:
-        print("\n🎉 エージェント設定バッチ修正完了")
-        print("📁 修正済みファイル: config/")
-        print("📦 バックアップ: backups/")
-    else:
-        print("\n❌ バッチ修正失敗")
+    if not success:
         sys.exit(1)
 
 if __name__ == "__main__":
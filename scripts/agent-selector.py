@@ -7,7 +7,16 @@ Claude Code エージェント選択・プロンプトカスタマイザー
 import os
 import sys
 import json
+import functools
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+# orjson がある場合は設定の保存に使用（未導入なら標準 json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # エージェント定義
 AGENTS = {
@@ -38,39 +47,98 @@ AGENTS = {
     }
 }
 
+
+class AgentInfo(NamedTuple):
+    """エージェント表示情報"""
+    name: str
+    role: str
+    color: str
+
+
+# 上記リテラルは他スクリプトが ast で解析するため残し、実行時は読み取り専用ビューに変換
+AGENTS = MappingProxyType({agent_id: AgentInfo(**info) for agent_id, info in AGENTS.items()})
+
+# 一覧表示用ブロック（色付きID・名前・役割）をインポート時に一度だけ整形
+_AGENT_LIST_BLOCKS = MappingProxyType({
+    agent_id: f"{info.color}@agent-{agent_id}\033[0m\n   名前: {info.name}\n   役割: {info.role}\n"
+    for agent_id, info in AGENTS.items()
+})
+
+# Bash エクスポート設定テンプレート（UTF-8 バイト列、% 書式で埋め込み）
+_BASH_EXPORT_TEMPLATE = '''# Claude Code エージェントプロンプト設定
+export CLAUDE_ACTIVE_AGENT="%(agent)s"
+export CLAUDE_AGENT_COLOR="%(color)s"
+export CLAUDE_RESET_COLOR="\\033[0m"
+export CLAUDE_PATH_COLOR="\\033[1;37m"
+
+# プロンプト設定
+export PS1="${CLAUDE_AGENT_COLOR}@agent-${CLAUDE_ACTIVE_AGENT}${CLAUDE_RESET_COLOR}:${CLAUDE_PATH_COLOR}\\W${CLAUDE_RESET_COLOR}$ "'''.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=128)
+def _render_prompt(active_agent, cwd_bytes):
+    """プロンプト文字列を生成（エージェントとディレクトリの組み合わせごとにキャッシュ）"""
+    # バイト列のままキャッシュキーにし、デコードはディレクトリ変更時のみ
+    current_dir = cwd_bytes.rpartition(b'/')[2].decode('utf-8', 'replace')
+    agent_info = AGENTS.get(active_agent, AGENTS["recipe-cto"])
+    
+    color = agent_info.color
+    reset = "\033[0m"
+    path_color = "\033[1;37m"  # 白
+    
+    return f"{color}@agent-{active_agent}{reset}:{path_color}{current_dir}{reset}$ "
+
 class AgentPromptManager:
     def __init__(self):
         self.config_file = Path(".claude-agent-config.json")
-        self.load_config()
+        # 最後に読み書きした設定ファイルの内容（同一内容の再保存を省略）
+        self._config_bytes = None
+    
+    @functools.cached_property
+    def config(self):
+        """設定（初回アクセス時に読み込み、設定を使わないコマンドでは読まない）"""
+        return self.load_config()
     
     def load_config(self):
         """設定ファイルを読み込み"""
+        _render_prompt.cache_clear()
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self._config_bytes = self.config_file.read_bytes()
+            self.config = json.loads(self._config_bytes)
         else:
             self.config = {"active_agent": "recipe-cto"}
             self.save_config()
+        return self.config
     
     def save_config(self):
-        """設定ファイルを保存"""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        """設定ファイルを保存（一時ファイルへ一括書き込み後、アトミックに置き換え）"""
+        if orjson is not None:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.config, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        if data == self._config_bytes:
+            return
+        
+        tmp_file = self.config_file.with_suffix('.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.config_file)
+        self._config_bytes = data
     
     def list_agents(self):
         """利用可能なエージェントリストを表示"""
         print("\n🤖 利用可能なエージェント:")
         print("=" * 60)
         
-        for agent_id, agent_info in AGENTS.items():
-            is_active = "★ " if agent_id == self.config.get("active_agent") else "  "
-            color = agent_info["color"]
-            reset = "\033[0m"
-            
-            print(f"{is_active}{color}@agent-{agent_id}{reset}")
-            print(f"   名前: {agent_info['name']}")
-            print(f"   役割: {agent_info['role']}")
-            print()
+        active_agent = self.config.get("active_agent")
+        for agent_id, block in _AGENT_LIST_BLOCKS.items():
+            is_active = "★ " if agent_id == active_agent else "  "
+            print(f"{is_active}{block}")
     
     def switch_agent(self, agent_id):
         """エージェントを切り替え"""
@@ -81,26 +149,20 @@ class AgentPromptManager:
         
         self.config["active_agent"] = agent_id
         self.save_config()
+        _render_prompt.cache_clear()
         
         agent_info = AGENTS[agent_id]
-        color = agent_info["color"]
+        color = agent_info.color
         reset = "\033[0m"
         
         print(f"✅ エージェントを {color}@agent-{agent_id}{reset} に切り替えました")
-        print(f"   役割: {agent_info['role']}")
+        print(f"   役割: {agent_info.role}")
         return True
     
     def get_current_prompt(self):
         """現在のプロンプト形式を取得"""
         active_agent = self.config.get("active_agent", "recipe-cto")
-        agent_info = AGENTS.get(active_agent, AGENTS["recipe-cto"])
-        
-        color = agent_info["color"]
-        reset = "\033[0m"
-        path_color = "\033[1;37m"  # 白
-        
-        current_dir = os.path.basename(os.getcwd())
-        return f"{color}@agent-{active_agent}{reset}:{path_color}{current_dir}{reset}$ "
+        return _render_prompt(active_agent, os.getcwdb())
     
     def show_prompt(self):
         """現在のプロンプトを表示"""
@@ -111,19 +173,11 @@ class AgentPromptManager:
         active_agent = self.config.get("active_agent", "recipe-cto")
         agent_info = AGENTS.get(active_agent, AGENTS["recipe-cto"])
         
-        bash_config = f"""
-# Claude Code エージェントプロンプト設定
-export CLAUDE_ACTIVE_AGENT="{active_agent}"
-export CLAUDE_AGENT_COLOR="{agent_info['color']}"
-export CLAUDE_RESET_COLOR="\\033[0m"
-export CLAUDE_PATH_COLOR="\\033[1;37m"
-
-# プロンプト設定
-export PS1="${{CLAUDE_AGENT_COLOR}}@agent-${{CLAUDE_ACTIVE_AGENT}}${{CLAUDE_RESET_COLOR}}:${{CLAUDE_PATH_COLOR}}\\W${{CLAUDE_RESET_COLOR}}$ "
-"""
-        
-        with open(".claude-prompt-export.sh", "w") as f:
-            f.write(bash_config.strip())
+        bash_config = _BASH_EXPORT_TEMPLATE % {
+            b'agent': active_agent.encode('utf-8'),
+            b'color': agent_info.color.encode('utf-8')
+        }
+        Path(".claude-prompt-export.sh").write_bytes(bash_config)
         
         print("✅ Bash設定を .claude-prompt-export.sh に出力しました")
         print("使用方法: source .claude-prompt-export.sh")
@@ -150,7 +204,7 @@ def main():
         active_agent = manager.config.get("active_agent", "recipe-cto")
         agent_info = AGENTS[active_agent]
         print(f"現在のエージェント: @agent-{active_agent}")
-        print(f"役割: {agent_info['role']}")
+        print(f"役割: {agent_info.role}")
     else:
         print("使用方法:")
         print("  python agent-selector.py list           - エージェント一覧")
@@ -9,14 +9,72 @@ Date: 2025-07-26
 Platform: macOS 12 (Monterey) 以降
 """
 
+import ctypes
+import ctypes.util
+import datetime
+import functools
 import platform
+import plistlib
+import re
+import shlex
 import subprocess
 import sys
 import shutil
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# 一括プローブの区切り（各コマンド出力の前に名前、後に終了コードを出す）
+_PROBE_SECTION_RE = re.compile(r'^===(\S+)===\n(.*?)\n===rc (\d+)===$', re.M | re.S)
+
+# sw_vers と同じ ProductVersion を保持する plist（読めればプロセス起動不要）
+_SYSTEM_VERSION_PLIST = Path('/System/Library/CoreServices/SystemVersion.plist')
+
+# 確認項目の表示名
+_CHECK_DISPLAY_NAMES = {
+    'os_version': 'macOSバージョン',
+    'python_version': 'Pythonバージョン',
+    'homebrew': 'Homebrew',
+    'commands': '必要コマンド',
+    'disk_space': 'ディスク容量',
+    'memory': 'メモリ容量',
+    'permissions': 'システム権限'
+}
+
+# 確認項目の依存関係（依存先が失敗した項目は確認せず失敗扱いにする）
+_CHECK_DEPENDENCIES = {
+    'homebrew': ('os_version', 'python_version'),
+    'commands': ('homebrew',),
+    'disk_space': ('os_version', 'python_version'),
+    'memory': ('os_version', 'python_version'),
+    'permissions': ('os_version', 'python_version'),
+}
+
+
+def _sysctl_memsize() -> Optional[int]:
+    """sysctlbyname("hw.memsize") をlibc経由で直接呼び出す（Darwin以外・失敗時はNone）"""
+    if sys.platform != 'darwin':
+        return None
+    
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.dylib', use_errno=True)
+    except OSError:
+        return None
+    
+    value = ctypes.c_uint64()
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    if libc.sysctlbyname(b"hw.memsize", ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+        return None
+    return value.value
+
+
+def _parse_ver(version: str) -> Tuple[int, int]:
+    """バージョン文字列をメジャー・マイナーの整数タプルに変換（"3.10" → (3, 10)、"13" → (13, 0)）"""
+    # 成分が1つしかない場合も (13,) < (13, 0) とならないよう2成分に揃える
+    return (tuple(int(part) for part in version.split('.')[:2]) + (0, 0))[:2]
+
+
 class SystemChecker:
     """macOS環境のシステム要件確認クラス"""
     
@@ -30,20 +88,130 @@ class SystemChecker:
             'homebrew_packages': ['python@3.11', 'git', 'wget']
         }
         self.check_results = {}
+        self._required_os_version = _parse_ver(self.requirements['os_version'])
+        self._required_python_version = _parse_ver(self.requirements['python_version'])
+        self._probe_cache: Dict[str, Tuple[int, str]] = {}
+        self._local = threading.local()
+        
+    def _emit(self, message: str = ""):
+        """チェック出力（並列実行中はスレッドごとのバッファに溜める）"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.append(message)
+    
+    def _run_check(self, check) -> Tuple[bool, List[str]]:
+        """チェックを実行し、結果とバッファした出力行を返す"""
+        self._local.buffer = []
+        try:
+            return check(), self._local.buffer
+        finally:
+            self._local.buffer = None
+    
+    def _run_check_after(self, key: str, check, futures: Dict) -> Tuple[bool, List[str]]:
+        """依存先の確認完了を待ってからチェックを実行（依存先が失敗していればスキップ）"""
+        failed = [
+            dependency for dependency in _CHECK_DEPENDENCIES.get(key, ())
+            if not futures[dependency].result()[0]
+        ]
+        
+        if failed:
+            names = '、'.join(_CHECK_DISPLAY_NAMES.get(name, name) for name in failed)
+            return False, [f"⏭  {_CHECK_DISPLAY_NAMES.get(key, key)}: スキップ（{names}の要件を満たしていないため）"]
+        
+        return self._run_check(check)
+    
+    def _probe_commands(self) -> Dict[str, Tuple[str, ...]]:
+        """一括実行するプローブコマンド一覧（名前 → argv）"""
+        return {
+            'brew_version': ('brew', '--version'),
+            'brew_list': ('brew', 'list', '--formula', '-1'),
+        }
+    
+    def _run_probe_batch(self) -> bool:
+        """全プローブを1回の /bin/sh 起動でまとめて実行し、結果をキャッシュ
+        
+        コマンドごとに fork/exec するとプロセス生成コストが支配的になるため、
+        区切り行を挟んで1つのシェルで順に実行し、標準出力を区切りごとに分解する。
+        失敗した場合はキャッシュを空のままにし、各チェックが個別実行に戻る。
+        """
+        script = ''.join(
+            f"echo '==={name}==='; {shlex.join(argv)} 2>/dev/null; printf '\\n===rc %d===\\n' $?\n"
+            for name, argv in self._probe_commands().items()
+        )
+        
+        try:
+            result = subprocess.run(
+                ['/bin/sh', '-c', script],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+        except OSError:
+            return False
         
+        self._probe_cache = {
+            name: (int(rc), output)
+            for name, output, rc in _PROBE_SECTION_RE.findall(result.stdout)
+        }
+        return bool(self._probe_cache)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _probe(cmd: Tuple[str, ...]) -> str:
+        """コマンドを個別実行して標準出力を返す（同一コマンドは再実行しない）"""
+        return subprocess.run(
+            list(cmd),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+    
+    def _probe_output(self, name: str, argv: Tuple[str, ...]) -> str:
+        """プローブ結果の標準出力を取得（一括結果がなければ個別実行）
+        
+        非0終了は subprocess.run(check=True) と同様に CalledProcessError を送出する。
+        """
+        cached = self._probe_cache.get(name)
+        if cached is None:
+            return self._probe(argv)
+        
+        returncode, output = cached
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, list(argv), output)
+        return output
+    
     def check_all(self) -> Dict[str, bool]:
         """全システム要件を確認"""
         print("=== PersonalCookRecipe システム要件確認開始 ===")
         print("macOS環境での3チャンネル統合レシピ監視システムの要件をチェックします\n")
         
-        # 各項目をチェック
-        self.check_results['os_version'] = self.check_macos_version()
-        self.check_results['python_version'] = self.check_python_version()
-        self.check_results['homebrew'] = self.check_homebrew()
-        self.check_results['commands'] = self.check_required_commands()
-        self.check_results['disk_space'] = self.check_disk_space()
-        self.check_results['memory'] = self.check_memory()
-        self.check_results['permissions'] = self.check_permissions()
+        # 外部コマンドのプローブを1プロセスでまとめて実行
+        self._run_probe_batch()
+        
+        # 各項目はI/O待ちなので並列にチェックし、出力は元の順序で表示
+        # 依存先より後に投入し、依存先が失敗した項目は実行しない（リスト順は依存順）
+        checks = [
+            ('os_version', self.check_macos_version),
+            ('python_version', self.check_python_version),
+            ('homebrew', self.check_homebrew),
+            ('commands', self.check_required_commands),
+            ('disk_space', self.check_disk_space),
+            ('memory', self.check_memory),
+            ('permissions', self.check_permissions),
+        ]
+        
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {}
+            for key, check in checks:
+                futures[key] = executor.submit(self._run_check_after, key, check, futures)
+            
+            for key, future in futures.items():
+                result, lines = future.result()
+                for line in lines:
+                    print(line)
+                self.check_results[key] = result
         
         # 結果サマリー表示
         self.display_summary()
@@ -52,79 +220,74 @@ class SystemChecker:
     
     def check_macos_version(self) -> bool:
         """macOSバージョン確認"""
-        print("📱 macOSバージョン確認中...")
+        self._emit("📱 macOSバージョン確認中...")
         
         try:
-            # sw_vers -productVersion コマンドでバージョン取得
-            result = subprocess.run(
-                ['sw_vers', '-productVersion'], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            current_version = result.stdout.strip()
-            print(f"   現在のmacOSバージョン: {current_version}")
-            
-            # バージョン比較（メジャーバージョンのみ）
-            current_major = float('.'.join(current_version.split('.')[:2]))
-            required_major = float(self.requirements['os_version'])
+            current_version = self._read_macos_version()
+            self._emit(f"   現在のmacOSバージョン: {current_version}")
             
-            if current_major >= required_major:
-                print(f"   ✅ macOS {self.requirements['os_version']}以降の要件を満たしています")
+            # バージョン比較（メジャー・マイナーの整数タプル）
+            if _parse_ver(current_version) >= self._required_os_version:
+                self._emit(f"   ✅ macOS {self.requirements['os_version']}以降の要件を満たしています")
                 return True
             else:
-                print(f"   ❌ macOS {self.requirements['os_version']}以降が必要です")
+                self._emit(f"   ❌ macOS {self.requirements['os_version']}以降が必要です")
                 return False
                 
-        except subprocess.CalledProcessError as e:
-            print(f"   ❌ macOSバージョン確認エラー: {e}")
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            self._emit(f"   ❌ macOSバージョン確認エラー: {e}")
             return False
     
+    def _read_macos_version(self) -> str:
+        """macOSバージョン文字列を取得
+        
+        SystemVersion.plist を直接読み、読めない場合のみ sw_vers -productVersion を実行する。
+        """
+        try:
+            with open(_SYSTEM_VERSION_PLIST, 'rb') as f:
+                return plistlib.load(f)['ProductVersion']
+        except (OSError, plistlib.InvalidFileException, KeyError):
+            return self._probe_output('sw_vers', ('sw_vers', '-productVersion')).strip()
+    
     def check_python_version(self) -> bool:
         """Pythonバージョン確認"""
-        print("🐍 Pythonバージョン確認中...")
+        self._emit("🐍 Pythonバージョン確認中...")
         
         try:
             current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-            print(f"   現在のPythonバージョン: {current_version}")
+            self._emit(f"   現在のPythonバージョン: {current_version}")
             
-            required_version = float(self.requirements['python_version'])
-            current_version_float = float(current_version)
+            # float比較では 3.10 < 3.9 と誤判定するため整数タプルで比較
+            current_version_tuple = tuple(sys.version_info[:2])
             
-            if current_version_float >= required_version:
-                print(f"   ✅ Python {self.requirements['python_version']}以降の要件を満たしています")
+            if current_version_tuple >= self._required_python_version:
+                self._emit(f"   ✅ Python {self.requirements['python_version']}以降の要件を満たしています")
                 
                 # Python3.11の推奨確認
-                if current_version_float >= 3.11:
-                    print("   🌟 Python 3.11以降を使用中（推奨）")
+                if current_version_tuple >= (3, 11):
+                    self._emit("   🌟 Python 3.11以降を使用中（推奨）")
                 else:
-                    print("   ⚠️  Python 3.11以降の使用を推奨します")
+                    self._emit("   ⚠️  Python 3.11以降の使用を推奨します")
                 
                 return True
             else:
-                print(f"   ❌ Python {self.requirements['python_version']}以降が必要です")
+                self._emit(f"   ❌ Python {self.requirements['python_version']}以降が必要です")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Pythonバージョン確認エラー: {e}")
+            self._emit(f"   ❌ Pythonバージョン確認エラー: {e}")
             return False
     
     def check_homebrew(self) -> bool:
         """Homebrewインストール確認"""
-        print("🍺 Homebrew確認中...")
+        self._emit("🍺 Homebrew確認中...")
         
         try:
-            result = subprocess.run(
-                ['brew', '--version'], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            
-            version_info = result.stdout.split('\n')[0]
-            print(f"   {version_info}")
-            print("   ✅ Homebrewがインストールされています")
+            version_info = self._probe_output(
+                'brew_version', ('brew', '--version')
+            ).split('\n')[0]
+            self._emit(f"   {version_info}")
+            self._emit("   ✅ Homebrewがインストールされています")
             
             # Homebrewパッケージ確認
             self._check_homebrew_packages()
@@ -132,104 +295,99 @@ class SystemChecker:
             return True
             
         except (subprocess.CalledProcessError, FileNotFoundError):
-            print("   ❌ Homebrewがインストールされていません")
-            print("   📝 以下のコマンドでインストールしてください:")
-            print('   /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"')
+            self._emit("   ❌ Homebrewがインストールされていません")
+            self._emit("   📝 以下のコマンドでインストールしてください:")
+            self._emit('   /bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"')
             return False
     
     def _check_homebrew_packages(self):
         """必要なHomebrewパッケージ確認"""
-        print("   📦 必要パッケージ確認中...")
+        self._emit("   📦 必要パッケージ確認中...")
+        
+        # パッケージごとに brew を起動せず、インストール済み一覧を1回だけ取得
+        try:
+            installed = frozenset(
+                self._probe_output('brew_list', ('brew', 'list', '--formula', '-1')).split()
+            )
+        except subprocess.CalledProcessError:
+            installed = frozenset()
         
         for package in self.requirements['homebrew_packages']:
-            try:
-                result = subprocess.run(
-                    ['brew', 'list', package], 
-                    capture_output=True, 
-                    text=True, 
-                    check=True
-                )
-                print(f"      ✅ {package}: インストール済み")
-            except subprocess.CalledProcessError:
-                print(f"      ⚠️  {package}: 未インストール（自動インストールで対応）")
+            if package in installed:
+                self._emit(f"      ✅ {package}: インストール済み")
+            else:
+                self._emit(f"      ⚠️  {package}: 未インストール（自動インストールで対応）")
     
     def check_required_commands(self) -> bool:
         """必要コマンド存在確認"""
-        print("⚙️  必要コマンド確認中...")
+        self._emit("⚙️  必要コマンド確認中...")
         
         all_commands_available = True
         
         for command in self.requirements['required_commands']:
             if shutil.which(command):
-                print(f"   ✅ {command}: 利用可能")
+                self._emit(f"   ✅ {command}: 利用可能")
             else:
-                print(f"   ❌ {command}: 見つかりません")
+                self._emit(f"   ❌ {command}: 見つかりません")
                 all_commands_available = False
         
         return all_commands_available
     
     def check_disk_space(self) -> bool:
         """ディスク容量確認"""
-        print("💾 ディスク容量確認中...")
+        self._emit("💾 ディスク容量確認中...")
         
         try:
-            # ホームディレクトリの利用可能容量確認
-            home_path = Path.home()
-            statvfs = os.statvfs(home_path)
-            
-            # 利用可能容量（GB）
-            available_gb = (statvfs.f_bavail * statvfs.f_frsize) / (1024**3)
+            # ホームディレクトリの利用可能容量確認（GB）
+            available_gb = shutil.disk_usage(Path.home()).free / (1024**3)
             required_gb = self.requirements['disk_space_gb']
             
-            print(f"   利用可能容量: {available_gb:.1f} GB")
-            print(f"   必要容量: {required_gb} GB")
+            self._emit(f"   利用可能容量: {available_gb:.1f} GB")
+            self._emit(f"   必要容量: {required_gb} GB")
             
             if available_gb >= required_gb:
-                print("   ✅ ディスク容量の要件を満たしています")
+                self._emit("   ✅ ディスク容量の要件を満たしています")
                 return True
             else:
-                print("   ❌ ディスク容量が不足しています")
+                self._emit("   ❌ ディスク容量が不足しています")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ ディスク容量確認エラー: {e}")
+            self._emit(f"   ❌ ディスク容量確認エラー: {e}")
             return False
     
     def check_memory(self) -> bool:
         """メモリ容量確認"""
-        print("🧠 メモリ容量確認中...")
+        self._emit("🧠 メモリ容量確認中...")
         
         try:
-            # sysctl hw.memsize でシステムメモリ取得
-            result = subprocess.run(
-                ['sysctl', 'hw.memsize'], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
+            # hw.memsize でシステムメモリ取得（取得できなければ sysctl コマンドで代替）
+            memory_bytes = _sysctl_memsize()
+            if memory_bytes is None:
+                output = self._probe_output('memsize', ('sysctl', 'hw.memsize'))
+                memory_bytes = int(output.split(': ')[1])
             
             # メモリサイズをGBに変換
-            memory_bytes = int(result.stdout.split(': ')[1])
             memory_gb = memory_bytes / (1024**3)
             required_gb = self.requirements['memory_gb']
             
-            print(f"   システムメモリ: {memory_gb:.1f} GB")
-            print(f"   必要メモリ: {required_gb} GB")
+            self._emit(f"   システムメモリ: {memory_gb:.1f} GB")
+            self._emit(f"   必要メモリ: {required_gb} GB")
             
             if memory_gb >= required_gb:
-                print("   ✅ メモリ容量の要件を満たしています")
+                self._emit("   ✅ メモリ容量の要件を満たしています")
                 return True
             else:
-                print("   ❌ メモリ容量が不足しています")
+                self._emit("   ❌ メモリ容量が不足しています")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ メモリ容量確認エラー: {e}")
+            self._emit(f"   ❌ メモリ容量確認エラー: {e}")
             return False
     
     def check_permissions(self) -> bool:
         """必要な権限確認"""
-        print("🔐 権限確認中...")
+        self._emit("🔐 権限確認中...")
         
         try:
             # ホームディレクトリ内での書き込み権限確認
@@ -240,11 +398,11 @@ class SystemChecker:
             test_file.write_text("permission test")
             test_file.unlink()
             
-            print("   ✅ 必要な書き込み権限があります")
+            self._emit("   ✅ 必要な書き込み権限があります")
             return True
             
         except Exception as e:
-            print(f"   ❌ 権限確認エラー: {e}")
+            self._emit(f"   ❌ 権限確認エラー: {e}")
             return False
     
     def display_summary(self):
@@ -258,17 +416,7 @@ class SystemChecker:
         
         for check_name, result in self.check_results.items():
             status = "✅ PASS" if result else "❌ FAIL"
-            check_display = {
-                'os_version': 'macOSバージョン',
-                'python_version': 'Pythonバージョン', 
-                'homebrew': 'Homebrew',
-                'commands': '必要コマンド',
-                'disk_space': 'ディスク容量',
-                'memory': 'メモリ容量',
-                'permissions': 'システム権限'
-            }
-            
-            print(f"{status} {check_display.get(check_name, check_name)}")
+            print(f"{status} {_CHECK_DISPLAY_NAMES.get(check_name, check_name)}")
         
         print(f"\n合計: {passed}/{total} 項目がパス")
         
@@ -283,7 +431,7 @@ class SystemChecker:
         """確認結果レポート生成"""
         report_lines = [
             "# PersonalCookRecipe システム要件確認レポート",
-            f"実行日時: {subprocess.run(['date'], capture_output=True, text=True).stdout.strip()}",
+            f"実行日時: {datetime.datetime.now().isoformat(timespec='seconds')}",
             f"実行環境: {platform.platform()}",
             "",
             "## 確認結果"
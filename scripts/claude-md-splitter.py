@@ -6,17 +6,39 @@ CLAUDE.md分割・最適化スクリプト
 
 import os
 import re
-import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
+
+# セクション見出し（前後の空白は line.strip() 相当で無視する）
+_HEADER_RE = re.compile(r'^\s*(#{1,4})\s+(\S.*?)\s*$')
+# コードブロック開始・終了行（先頭空白を許容）
+_CODE_FENCE_RE = re.compile(r'\s*```')
+
+
+def _keyword_re(keywords: Tuple[str, ...]) -> re.Pattern:
+    """いずれかのキーワードを含むか1回の検索で判定するパターン"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# 検索用タグにする重要キーワード
+_TAG_KEYWORDS = (
+    'SPARC', 'Agent', 'Batch', 'Parallel', 'Concurrent', 'MCP',
+    'TodoWrite', 'Task', 'GitHub', 'API', 'Configuration',
+    'Workflow', 'Performance', 'Security', 'Testing'
+)
+_TAG_BY_LOWER = {keyword.lower(): keyword for keyword in _TAG_KEYWORDS}
+# 全キーワードを1回の走査で拾う（先読みで重なった出現も取りこぼさない）
+_TAG_RE = re.compile('(?=(%s))' % '|'.join(re.escape(k) for k in _TAG_BY_LOWER))
 
 @dataclass
 class DocumentSection:
     """ドキュメントセクション"""
     title: str
-    content: str
+    content: List[str]  # 本文の行リスト（改行なし。'\n' で連結したものが本文）
     priority: int
     category: str
     line_start: int
@@ -26,34 +48,67 @@ class DocumentSection:
 class ClaudeMdSplitter:
     """CLAUDE.md分割クラス"""
     
+    # リスト項目とみなす行頭
+    _LIST_PREFIXES = ('- ', '* ', '1. ', '2. ')
+    
+    # タイトルのキーワードによる優先度判定（1: 最重要 〜 3: 中程度、該当なしは 4: 低）
+    _PRIORITY_KEYWORDS = (
+        ('critical', '🚨', 'absolute rule', 'mandatory', '重要'),
+        ('sparc', 'agent', 'batch', 'concurrent', 'parallel'),
+        ('workflow', 'example', 'pattern', 'best practices'),
+    )
+    _PRIORITY_RES = tuple(_keyword_re(keywords) for keywords in _PRIORITY_KEYWORDS)
+    
+    # タイトルのキーワードによるカテゴリ判定（先に一致したものを採用、該当なしは general）
+    _CATEGORY_KEYWORDS = (
+        ('execution', ('concurrent', 'parallel', 'batch', 'execution')),
+        ('agents', ('agent', 'swarm', 'coordination')),
+        ('methodology', ('sparc', 'methodology', 'development')),
+        ('tools', ('mcp', 'tool', 'integration')),
+        ('examples', ('workflow', 'example', 'pattern')),
+    )
+    _CATEGORY_RES = tuple(
+        (category, _keyword_re(keywords)) for category, keywords in _CATEGORY_KEYWORDS
+    )
+    
     def __init__(self, source_file: str = "/mnt/Linux-ExHDD/PersonalCookingRecipe/CLAUDE.md"):
         self.source_file = Path(source_file)
         self.output_dir = self.source_file.parent / "docs" / "claude-config"
-        self.sections: List[DocumentSection] = []
+        # 優先度（1〜4）ごとのセクション一覧。解析時に振り分けるため全体ソートが不要
+        self.priority_buckets: Dict[int, List[DocumentSection]] = {
+            priority: [] for priority in (1, 2, 3, 4)
+        }
+        self.categories: Dict[str, List[DocumentSection]] = {}
         self.max_section_size = 300  # 行数制限
     
-    async def split_and_optimize(self) -> bool:
+    @property
+    def sections(self) -> List[DocumentSection]:
+        """全セクション（優先度順）"""
+        return list(chain.from_iterable(self.priority_buckets.values()))
+    
+    def split_and_optimize(self) -> bool:
         """分割・最適化の実行"""
         try:
             print("📄 CLAUDE.md分割・最適化開始")
             
             # 1. ファイル解析
-            await self._analyze_document()
+            self._analyze_document()
             
             # 2. セクション分割
-            await self._split_sections()
+            self._split_sections()
             
             # 3. 最適化
-            await self._optimize_sections()
-            
-            # 4. ファイル生成
-            await self._generate_split_files()
+            self._optimize_sections()
             
-            # 5. メインファイル生成
-            await self._generate_main_config()
-            
-            # 6. インデックス生成
-            await self._generate_index()
+            # 4-6. 分割ファイル・メインファイル・インデックスは互いに独立した書き込みなので並列生成
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            generators = [
+                self._generate_split_files,
+                self._generate_main_config,
+                self._generate_index,
+            ]
+            with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                list(executor.map(lambda generate: generate(), generators))
             
             print("✅ CLAUDE.md分割・最適化完了")
             return True
@@ -62,58 +117,62 @@ class ClaudeMdSplitter:
             print(f"❌ 分割エラー: {e}")
             return False
     
-    async def _analyze_document(self):
+    def _analyze_document(self):
         """ドキュメント構造解析"""
         print("🔍 ドキュメント構造解析中...")
         
-        with open(self.source_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
         current_section = None
+        # 全行をリストに読み込まず、セクション本文だけを行単位で溜める
         section_content = []
+        section_size = 0
         line_num = 0
         
-        for i, line in enumerate(lines, 1):
-            line_num = i
-            
-            # セクション開始検出（##、###等）
-            header_match = re.match(r'^(#{1,4})\s+(.+)', line.strip())
-            
-            if header_match:
-                # 前のセクションを保存
-                if current_section and section_content:
-                    section = DocumentSection(
-                        title=current_section,
-                        content=''.join(section_content),
-                        priority=self._calculate_priority(current_section),
-                        category=self._determine_category(current_section),
-                        line_start=line_num - len(section_content),
-                        line_end=line_num - 1,
-                        size=len(section_content)
-                    )
-                    self.sections.append(section)
+        with open(self.source_file, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                # セクション開始検出（##、###等）
+                header_match = _HEADER_RE.match(line)
                 
-                # 新しいセクション開始
-                level = len(header_match.group(1))
-                title = header_match.group(2)
-                current_section = title
-                section_content = [line]
-            else:
-                if current_section:
-                    section_content.append(line)
+                if header_match:
+                    # 前のセクションを保存
+                    if current_section and section_size:
+                        # 末尾の改行の後ろは空行として扱う（本文を '\n' で分割した形と同じ）
+                        section_content.append('')
+                        section = DocumentSection(
+                            title=current_section,
+                            content=section_content,
+                            priority=self._calculate_priority(current_section),
+                            category=self._determine_category(current_section),
+                            line_start=line_num - section_size,
+                            line_end=line_num - 1,
+                            size=section_size
+                        )
+                        self.priority_buckets[section.priority].append(section)
+                    
+                    # 新しいセクション開始
+                    level = len(header_match.group(1))
+                    title = header_match.group(2)
+                    current_section = title
+                    section_content = [line.rstrip('\n')]
+                    section_size = 1
+                else:
+                    if current_section:
+                        section_content.append(line.rstrip('\n'))
+                        section_size += 1
         
         # 最後のセクション処理
-        if current_section and section_content:
+        if current_section and section_size:
+            if line.endswith('\n'):
+                section_content.append('')
             section = DocumentSection(
                 title=current_section,
-                content=''.join(section_content),
+                content=section_content,
                 priority=self._calculate_priority(current_section),
                 category=self._determine_category(current_section),
-                line_start=line_num - len(section_content) + 1,
+                line_start=line_num - section_size + 1,
                 line_end=line_num,
-                size=len(section_content)
+                size=section_size
             )
-            self.sections.append(section)
+            self.priority_buckets[section.priority].append(section)
         
         print(f"✅ {len(self.sections)} セクション検出")
     
@@ -121,23 +180,9 @@ class ClaudeMdSplitter:
         """セクション優先度計算"""
         title_lower = title.lower()
         
-        # 最重要（1）
-        if any(keyword in title_lower for keyword in [
-            'critical', '🚨', 'absolute rule', 'mandatory', '重要'
-        ]):
-            return 1
-        
-        # 重要（2）
-        if any(keyword in title_lower for keyword in [
-            'sparc', 'agent', 'batch', 'concurrent', 'parallel'
-        ]):
-            return 2
-        
-        # 中程度（3）
-        if any(keyword in title_lower for keyword in [
-            'workflow', 'example', 'pattern', 'best practices'
-        ]):
-            return 3
+        for level, pattern in enumerate(self._PRIORITY_RES, 1):
+            if pattern.search(title_lower):
+                return level
         
         # 低（4）
         return 4
@@ -146,49 +191,35 @@ class ClaudeMdSplitter:
         """セクションカテゴリ判定"""
         title_lower = title.lower()
         
-        if any(keyword in title_lower for keyword in [
-            'concurrent', 'parallel', 'batch', 'execution'
-        ]):
-            return 'execution'
-        elif any(keyword in title_lower for keyword in [
-            'agent', 'swarm', 'coordination'
-        ]):
-            return 'agents'
-        elif any(keyword in title_lower for keyword in [
-            'sparc', 'methodology', 'development'
-        ]):
-            return 'methodology'
-        elif any(keyword in title_lower for keyword in [
-            'mcp', 'tool', 'integration'
-        ]):
-            return 'tools'
-        elif any(keyword in title_lower for keyword in [
-            'workflow', 'example', 'pattern'
-        ]):
-            return 'examples'
-        else:
-            return 'general'
+        for category, pattern in self._CATEGORY_RES:
+            if pattern.search(title_lower):
+                return category
+        
+        return 'general'
     
-    async def _split_sections(self):
+    def _split_sections(self):
         """セクション分割処理"""
         print("✂️ セクション分割処理中...")
         
-        split_sections = []
-        
-        for section in self.sections:
-            if section.size <= self.max_section_size:
-                split_sections.append(section)
-            else:
-                # 大きなセクションを分割
-                subsections = await self._split_large_section(section)
-                split_sections.extend(subsections)
+        # 分割後のセクションは元の優先度を引き継ぐので同じバケット内で置き換える
+        for bucket in self.priority_buckets.values():
+            split_sections = []
+            
+            for section in bucket:
+                if section.size <= self.max_section_size:
+                    split_sections.append(section)
+                else:
+                    # 大きなセクションを分割
+                    subsections = self._split_large_section(section)
+                    split_sections.extend(subsections)
+            
+            bucket[:] = split_sections
         
-        self.sections = split_sections
         print(f"✅ {len(self.sections)} セクションに分割")
     
-    async def _split_large_section(self, section: DocumentSection) -> List[DocumentSection]:
+    def _split_large_section(self, section: DocumentSection) -> List[DocumentSection]:
         """大きなセクションの分割"""
-        lines = section.content.split('\n')
+        lines = section.content
         subsections = []
         
         current_lines = []
@@ -201,10 +232,9 @@ class ClaudeMdSplitter:
                 # 適切な分割点を探す
                 split_point = self._find_split_point(current_lines)
                 
-                subsection_content = '\n'.join(current_lines[:split_point])
                 subsection = DocumentSection(
                     title=f"{section.title} (Part {subsection_num})",
-                    content=subsection_content,
+                    content=current_lines[:split_point],
                     priority=section.priority,
                     category=section.category,
                     line_start=0,  # 再計算が必要
@@ -218,10 +248,9 @@ class ClaudeMdSplitter:
         
         # 残りの行
         if current_lines:
-            subsection_content = '\n'.join(current_lines)
             subsection = DocumentSection(
                 title=f"{section.title} (Part {subsection_num})",
-                content=subsection_content,
+                content=current_lines,
                 priority=section.priority,
                 category=section.category,
                 line_start=0,
@@ -234,6 +263,9 @@ class ClaudeMdSplitter:
     
     def _find_split_point(self, lines: List[str]) -> int:
         """適切な分割点を見つける"""
+        # リスト項目以外の行は、空行・コードブロック終了が見つからない場合の候補
+        non_list_point = None
+        
         # 逆順で検索して、適切な分割点を見つける
         for i in range(len(lines) - 1, max(0, len(lines) - 50), -1):
             line = lines[i].strip()
@@ -246,81 +278,97 @@ class ClaudeMdSplitter:
             if line == '```':
                 return i + 1
             
-            # リスト項目終了での分割
-            if not line.startswith(('- ', '* ', '1. ', '2. ')):
-                return i + 1
+            # リスト項目終了での分割（最も後ろの候補を保持）
+            if non_list_point is None and not line.startswith(self._LIST_PREFIXES):
+                non_list_point = i + 1
+        
+        if non_list_point is not None:
+            return non_list_point
         
         # 見つからない場合は中間点
         return len(lines) // 2
     
-    async def _optimize_sections(self):
+    def _optimize_sections(self):
         """セクション最適化"""
         print("⚡ セクション最適化中...")
         
-        # 優先度でソート
-        self.sections.sort(key=lambda x: (x.priority, x.category, x.title))
+        # 優先度はバケットで分かれているので、バケット内をカテゴリ・タイトル順に並べる
+        for bucket in self.priority_buckets.values():
+            bucket.sort(key=lambda x: (x.category, x.title))
+        
+        sections = self.sections
         
         # 内容最適化
-        for section in self.sections:
-            section.content = await self._optimize_content(section.content)
+        for section in sections:
+            section.content = self._optimize_content(section.content)
+        
+        # カテゴリ別グループ（ファイル生成・メイン設定・インデックスで共用）
+        categories = defaultdict(list)
+        for section in sections:
+            categories[section.category].append(section)
+        self.categories = dict(categories)
         
         print("✅ セクション最適化完了")
     
-    async def _optimize_content(self, content: str) -> str:
-        """コンテンツ最適化"""
-        lines = content.split('\n')
+    def _optimize_content(self, lines: List[str]) -> List[str]:
+        """コンテンツ最適化（行リストを受け取り最適化後の行リストを返す）"""
         optimized_lines = []
+        # 直前に出力した行が空行か（毎回 optimized_lines[-1].strip() し直さない）
+        prev_blank = False
         
         for line in lines:
+            is_blank = not line.strip()
+            
             # 重複する空行を除去
-            if line.strip() == '' and optimized_lines and optimized_lines[-1].strip() == '':
+            if is_blank and prev_blank:
                 continue
             
             # 長すぎる行を短縮（コードブロックは除く）
-            if len(line) > 120 and not line.strip().startswith('```'):
-                # 適切な位置で改行
-                if ' ' in line:
-                    words = line.split(' ')
-                    current_line = ''
-                    for word in words:
-                        if len(current_line + ' ' + word) > 120:
-                            optimized_lines.append(current_line)
-                            current_line = word
-                        else:
-                            current_line += ' ' + word if current_line else word
-                    if current_line:
-                        optimized_lines.append(current_line)
-                else:
-                    optimized_lines.append(line)
+            if len(line) > 120 and not _CODE_FENCE_RE.match(line) and ' ' in line:
+                # 適切な位置で改行（行の長さは連結せずに加算で管理）
+                parts = []
+                current_len = 0
+                for word in line.split(' '):
+                    if current_len + 1 + len(word) > 120:
+                        optimized_lines.append(' '.join(parts))
+                        parts = [word]
+                        current_len = len(word)
+                    elif current_len:
+                        parts.append(word)
+                        current_len += 1 + len(word)
+                    else:
+                        parts = [word]
+                        current_len = len(word)
+                if current_len:
+                    optimized_lines.append(' '.join(parts))
+                if optimized_lines:
+                    prev_blank = not optimized_lines[-1].strip()
             else:
                 optimized_lines.append(line)
+                prev_blank = is_blank
         
-        return '\n'.join(optimized_lines)
+        return optimized_lines
     
-    async def _generate_split_files(self):
+    def _generate_split_files(self):
         """分割ファイル生成"""
         print("📝 分割ファイル生成中...")
         
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # カテゴリ別にファイル生成
-        categories = {}
-        for section in self.sections:
-            if section.category not in categories:
-                categories[section.category] = []
-            categories[section.category].append(section)
-        
-        for category, sections in categories.items():
-            await self._generate_category_file(category, sections)
+        categories = self.categories
+        if categories:
+            with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+                list(executor.map(self._generate_category_file, categories.keys(), categories.values()))
         
         print(f"✅ {len(categories)} カテゴリファイル生成完了")
     
-    async def _generate_category_file(self, category: str, sections: List[DocumentSection]):
+    def _generate_category_file(self, category: str, sections: List[DocumentSection]):
         """カテゴリ別ファイル生成"""
         filename = f"claude-config-{category}.md"
         filepath = self.output_dir / filename
         
-        content = f"""# Claude Code Configuration - {category.title()}
+        parts = [f"""# Claude Code Configuration - {category.title()}
 
 ## 概要
 
@@ -331,21 +379,20 @@ class ClaudeMdSplitter:
 
 ---
 
-"""
+"""]
         
         for section in sections:
-            content += f"\n## {section.title}\n\n"
-            content += section.content
-            content += "\n\n---\n\n"
+            parts.append(f"\n## {section.title}\n\n")
+            parts.append('\n'.join(section.content))
+            parts.append("\n\n---\n\n")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(''.join(parts), encoding='utf-8')
     
-    async def _generate_main_config(self):
+    def _generate_main_config(self):
         """メイン設定ファイル生成"""
         print("📋 メイン設定ファイル生成中...")
         
-        main_content = f"""# Claude Code Configuration - Main
+        parts = [f"""# Claude Code Configuration - Main
 
 ## 🚨 重要: この設定は分割されています
 
@@ -357,16 +404,10 @@ CLAUDE.md ファイルが {len(self.sections)} セクションに分割・最適
 
 ## 📁 分割ファイル構成
 
-"""
-        
-        categories = {}
-        for section in self.sections:
-            if section.category not in categories:
-                categories[section.category] = []
-            categories[section.category].append(section)
+"""]
         
-        for category, sections in categories.items():
-            main_content += f"""
+        for category, sections in self.categories.items():
+            parts.append(f"""
 ### {category.title()} (`claude-config-{category}.md`)
 
 - セクション数: {len(sections)}
@@ -374,14 +415,14 @@ CLAUDE.md ファイルが {len(self.sections)} セクションに分割・最適
 - 優先度: {min(section.priority for section in sections)}
 
 セクション一覧:
-"""
+""")
             for section in sections[:5]:  # 最初の5つのみ表示
-                main_content += f"- {section.title}\n"
+                parts.append(f"- {section.title}\n")
             
             if len(sections) > 5:
-                main_content += f"- ... その他 {len(sections) - 5} セクション\n"
+                parts.append(f"- ... その他 {len(sections) - 5} セクション\n")
         
-        main_content += f"""
+        parts.append(f"""
 
 ## 📖 使用方法
 
@@ -432,102 +473,86 @@ python scripts/claude-md-merger.py
 ---
 
 **注意**: このファイルは自動生成されています。直接編集せず、元のカテゴリファイルを編集してください。
-"""
+""")
         
         main_file = self.source_file.parent / "CLAUDE-MAIN.md"
-        with open(main_file, 'w', encoding='utf-8') as f:
-            f.write(main_content)
+        main_file.write_text(''.join(parts), encoding='utf-8')
         
         print("✅ メイン設定ファイル生成完了")
     
-    async def _generate_index(self):
+    def _generate_index(self):
         """インデックス生成"""
         print("📚 インデックス生成中...")
         
-        index_content = f"""# Claude Configuration Index
+        parts = [f"""# Claude Configuration Index
 
 ## 📋 セクション一覧
 
 生成日時: {datetime.now().isoformat()}
 総セクション数: {len(self.sections)}
 
-"""
+"""]
         
         # 優先度別インデックス
-        for priority in [1, 2, 3, 4]:
-            priority_sections = [s for s in self.sections if s.priority == priority]
+        for priority, priority_sections in self.priority_buckets.items():
             if priority_sections:
                 priority_name = ["最重要", "重要", "中程度", "低"][priority - 1]
-                index_content += f"\n## {priority_name} (優先度 {priority})\n\n"
+                parts.append(f"\n## {priority_name} (優先度 {priority})\n\n")
                 
                 for section in priority_sections:
-                    index_content += f"- **{section.title}** (`claude-config-{section.category}.md`)\n"
-                    index_content += f"  - カテゴリ: {section.category}\n"
-                    index_content += f"  - サイズ: {section.size} 行\n\n"
+                    parts.append(f"- **{section.title}** (`claude-config-{section.category}.md`)\n")
+                    parts.append(f"  - カテゴリ: {section.category}\n")
+                    parts.append(f"  - サイズ: {section.size} 行\n\n")
         
         # カテゴリ別インデックス
-        index_content += "\n## 📁 カテゴリ別インデックス\n\n"
+        parts.append("\n## 📁 カテゴリ別インデックス\n\n")
         
-        categories = {}
-        for section in self.sections:
-            if section.category not in categories:
-                categories[section.category] = []
-            categories[section.category].append(section)
-        
-        for category, sections in categories.items():
-            index_content += f"### {category.title()}\n\n"
+        for category, sections in self.categories.items():
+            parts.append(f"### {category.title()}\n\n")
             for section in sections:
-                index_content += f"- {section.title} ({section.size}行)\n"
-            index_content += "\n"
+                parts.append(f"- {section.title} ({section.size}行)\n")
+            parts.append("\n")
         
         # 検索用タグ
-        index_content += "\n## 🏷️ 検索用タグ\n\n"
+        parts.append("\n## 🏷️ 検索用タグ\n\n")
         
-        all_tags = set()
-        for section in self.sections:
-            tags = self._extract_tags(section.content)
-            all_tags.update(tags)
-        
-        for tag in sorted(all_tags):
-            relevant_sections = []
-            for section in self.sections:
-                if tag.lower() in section.content.lower():
-                    relevant_sections.append(section)
+        tag_index = self._build_tag_index()
+        
+        for tag in sorted(tag_index):
+            relevant_sections = tag_index[tag]
             
-            if relevant_sections:
-                index_content += f"**{tag}**: "
-                index_content += ", ".join([s.title for s in relevant_sections[:3]])
-                if len(relevant_sections) > 3:
-                    index_content += f" (他{len(relevant_sections)-3}件)"
-                index_content += "\n\n"
+            parts.append(f"**{tag}**: ")
+            parts.append(", ".join([s.title for s in relevant_sections[:3]]))
+            if len(relevant_sections) > 3:
+                parts.append(f" (他{len(relevant_sections)-3}件)")
+            parts.append("\n\n")
         
         index_file = self.output_dir / "index.md"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        index_file.write_text(''.join(parts), encoding='utf-8')
         
         print("✅ インデックス生成完了")
     
-    def _extract_tags(self, content: str) -> List[str]:
-        """コンテンツからタグ抽出"""
-        tags = []
+    def _build_tag_index(self) -> Dict[str, List[DocumentSection]]:
+        """タグ → 該当セクション一覧の転置インデックス生成
         
-        # 重要なキーワードを抽出
-        keywords = [
-            'SPARC', 'Agent', 'Batch', 'Parallel', 'Concurrent', 'MCP',
-            'TodoWrite', 'Task', 'GitHub', 'API', 'Configuration',
-            'Workflow', 'Performance', 'Security', 'Testing'
-        ]
+        セクションごとに小文字化した本文を1回だけ走査し、含まれるキーワードを全て拾う。
+        キーワードは改行を含まないため、本文を連結せず行ごとに走査する。
+        """
+        tag_index: Dict[str, List[DocumentSection]] = {}
         
-        for keyword in keywords:
-            if keyword.lower() in content.lower():
-                tags.append(keyword)
+        for section in self.sections:
+            found = set()
+            for line in section.content:
+                found.update(_TAG_RE.findall(line.lower()))
+            for keyword in found:
+                tag_index.setdefault(_TAG_BY_LOWER[keyword], []).append(section)
         
-        return tags
+        return tag_index
 
-async def main():
+def main():
     """メイン実行関数"""
     splitter = ClaudeMdSplitter()
-    success = await splitter.split_and_optimize()
+    success = splitter.split_and_optimize()
     
     if success:
         print("\n🎉 CLAUDE.md分割・最適化完了")
@@ -538,4 +563,4 @@ async def main():
         print("\n❌ 分割処理失敗")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
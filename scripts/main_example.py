@@ -12,14 +12,21 @@ This example demonstrates:
 """
 
 import asyncio
+import functools
+import io
 import logging
+import platform
+from contextlib import contextmanager, redirect_stdout
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
 import json
 import sys
+import httpx
+from typing import Awaitable, Callable, Dict, List, Optional
 
 # Import all services
-from services.youtube_service import YouTubeService, MonitoringConfig
+from services.youtube_service import YouTubeService, MonitoringConfig, YouTubeChannel, YouTubeVideo
 from services.claude_service import ClaudeService, AnalysisType
 from services.notion_service import NotionService, RecipePageData
 from services.gmail_service import GmailService, EmailRecipient, NotificationConfig, NotificationType
@@ -32,6 +39,51 @@ from config.rate_limiter import RateLimiter
 from config.error_handler import APIErrorHandler
 from config.logger_config import setup_logging, get_api_logger
 
+# Optional HTTP/2 support for httpx
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+# Optional faster event loops
+try:
+    import uringcore  # io_uring based loop, Linux 5.11+
+except ImportError:
+    uringcore = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Output buffer of the demo stage running in the current task (None outside stages)
+_stage_buffers: ContextVar[Optional[Dict[str, io.StringIO]]] = ContextVar('stage_buffers', default=None)
+
+
+class _StageConsole(io.TextIOBase):
+    """
+    Console stream that diverts writes from a running demo stage into its buffer
+    
+    Output is buffered per channel ('stdout' or 'stderr') so it can be
+    replayed to the stream it was meant for. Once the stage has flushed and
+    closed its buffers, writes from tasks it left running go straight through.
+    """
+    
+    def __init__(self, stream, channel: str):
+        self.stream = stream
+        self.channel = channel
+    
+    def write(self, text: str) -> int:
+        buffers = _stage_buffers.get()
+        buffer = buffers[self.channel] if buffers is not None else None
+        if buffer is None or buffer.closed:
+            return self.stream.write(text)
+        return buffer.write(text)
+    
+    def flush(self) -> None:
+        self.stream.flush()
+
 
 class RecipeDevAPIDemo:
     """
@@ -58,24 +110,24 @@ class RecipeDevAPIDemo:
         self.rate_limiter = RateLimiter()
         self.error_handler = APIErrorHandler(config_dir)
         
-        # API services
-        self.youtube_service = None
-        self.claude_service = None
-        self.notion_service = None
-        self.gmail_service = None
+        # One pooled HTTP client (HTTP/2 when available) shared by the httpx-based services
+        self.http = httpx.AsyncClient(
+            http2=h2 is not None,
+            timeout=30,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+        )
         
-        # Integration services
-        self.recipe_analyzer = None
-        self.notification_manager = None
+        # API and integration services are built lazily on first access
+        # (see the cached properties below), so unused services cost nothing
         
         self.logger.info("Recipe-DevAPI Demo initialized")
     
     async def initialize_services(self) -> bool:
         """
-        Initialize all API services with authentication
+        Validate API credentials; the services themselves are created on first use
         
         Returns:
-            True if all services initialized successfully
+            True if all required credentials are available
         """
         try:
             self.logger.info("🔧 Initializing API services...")
@@ -94,91 +146,118 @@ class RecipeDevAPIDemo:
             
             self.logger.info("✅ API credentials validated")
             
-            # Initialize YouTube service
-            youtube_key = self.api_manager.get_youtube_credentials()
-            if youtube_key:
-                self.youtube_service = YouTubeService(
-                    api_key=youtube_key,
-                    rate_limiter=self.rate_limiter,
-                    error_handler=self.error_handler,
-                    cache_dir=self.config_dir / "cache"
-                )
-                self.logger.info("✅ YouTube service initialized")
-            else:
+            if not self.api_manager.get_youtube_credentials():
                 self.logger.error("❌ YouTube API key not found")
                 return False
             
-            # Initialize Claude service
-            claude_key = self.api_manager.get_claude_credentials()
-            if claude_key:
-                self.claude_service = ClaudeService(
-                    api_key=claude_key,
-                    rate_limiter=self.rate_limiter,
-                    error_handler=self.error_handler
-                )
-                self.logger.info("✅ Claude service initialized")
-            else:
+            if not self.api_manager.get_claude_credentials():
                 self.logger.error("❌ Claude API key not found")
                 return False
             
-            # Initialize Notion service
             notion_creds = self.api_manager.get_notion_credentials()
-            if notion_creds['token'] and notion_creds['database_id']:
-                self.notion_service = NotionService(
-                    token=notion_creds['token'],
-                    database_id=notion_creds['database_id'],
-                    rate_limiter=self.rate_limiter,
-                    error_handler=self.error_handler
-                )
-                self.logger.info("✅ Notion service initialized")
-            else:
+            if not (notion_creds['token'] and notion_creds['database_id']):
                 self.logger.error("❌ Notion credentials not found")
                 return False
             
-            # Initialize Gmail service
-            gmail_creds = self.api_manager.get_gmail_credentials()
-            if gmail_creds:
-                self.gmail_service = GmailService(
-                    credentials=gmail_creds,
-                    rate_limiter=self.rate_limiter,
-                    error_handler=self.error_handler,
-                    config_dir=self.config_dir,
-                    sender_email="your-email@gmail.com"  # Update with your email
-                )
-                self.logger.info("✅ Gmail service initialized")
-            else:
+            if not self.api_manager.get_gmail_credentials():
                 self.logger.warning("⚠️ Gmail credentials not found - notifications disabled")
-                # Create a mock Gmail service for demo
-                self.gmail_service = GmailService(
-                    credentials=None,
-                    rate_limiter=self.rate_limiter,
-                    error_handler=self.error_handler,
-                    config_dir=self.config_dir
-                )
-            
-            # Initialize integration services
-            self.recipe_analyzer = RecipeAnalyzer(
-                youtube_service=self.youtube_service,
-                claude_service=self.claude_service,
-                notion_service=self.notion_service,
-                gmail_service=self.gmail_service,
-                error_handler=self.error_handler,
-                config_dir=self.config_dir
-            )
             
-            self.notification_manager = NotificationManager(
-                gmail_service=self.gmail_service,
-                error_handler=self.error_handler,
-                config_dir=self.config_dir
-            )
-            
-            self.logger.info("✅ All services initialized successfully")
+            self.logger.info("✅ All services ready (created on first use)")
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Service initialization failed: {e}")
             return False
     
+    def _is_started(self, service_name: str) -> bool:
+        """Check whether a lazily created service has been built"""
+        return service_name in self.__dict__
+    
+    @functools.cached_property
+    def youtube_service(self) -> YouTubeService:
+        """YouTube service, created on first access"""
+        service = YouTubeService(
+            api_key=self.api_manager.get_youtube_credentials(),
+            rate_limiter=self.rate_limiter,
+            error_handler=self.error_handler,
+            cache_dir=self.config_dir / "cache"
+        )
+        self.logger.info("✅ YouTube service initialized")
+        return service
+    
+    @functools.cached_property
+    def claude_service(self) -> ClaudeService:
+        """Claude service, created on first access"""
+        service = ClaudeService(
+            api_key=self.api_manager.get_claude_credentials(),
+            rate_limiter=self.rate_limiter,
+            error_handler=self.error_handler,
+            cache_dir=self.config_dir / "cache",
+            http_client=self.http
+        )
+        self.logger.info("✅ Claude service initialized")
+        return service
+    
+    @functools.cached_property
+    def notion_service(self) -> NotionService:
+        """Notion service, created on first access"""
+        notion_creds = self.api_manager.get_notion_credentials()
+        service = NotionService(
+            token=notion_creds['token'],
+            database_id=notion_creds['database_id'],
+            rate_limiter=self.rate_limiter,
+            error_handler=self.error_handler
+        )
+        self.logger.info("✅ Notion service initialized")
+        return service
+    
+    @functools.cached_property
+    def gmail_service(self) -> GmailService:
+        """Gmail service, created on first access"""
+        gmail_creds = self.api_manager.get_gmail_credentials()
+        if gmail_creds:
+            service = GmailService(
+                credentials=gmail_creds,
+                rate_limiter=self.rate_limiter,
+                error_handler=self.error_handler,
+                config_dir=self.config_dir,
+                sender_email="your-email@gmail.com",  # Update with your email
+                http_client=self.http
+            )
+            self.logger.info("✅ Gmail service initialized")
+        else:
+            # Create a mock Gmail service for demo
+            service = GmailService(
+                credentials=None,
+                rate_limiter=self.rate_limiter,
+                error_handler=self.error_handler,
+                config_dir=self.config_dir,
+                http_client=self.http
+            )
+        return service
+    
+    @functools.cached_property
+    def recipe_analyzer(self) -> RecipeAnalyzer:
+        """Recipe analyzer, created on first access"""
+        return RecipeAnalyzer(
+            youtube_service=self.youtube_service,
+            claude_service=self.claude_service,
+            notion_service=self.notion_service,
+            gmail_service=self.gmail_service,
+            error_handler=self.error_handler,
+            config_dir=self.config_dir
+        )
+    
+    @functools.cached_property
+    def notification_manager(self) -> NotificationManager:
+        """Notification manager, created on first access"""
+        return NotificationManager(
+            gmail_service=self.gmail_service,
+            error_handler=self.error_handler,
+            config_dir=self.config_dir,
+            http_client=self.http
+        )
+    
     async def test_api_connections(self) -> bool:
         """
         Test connections to all APIs
@@ -242,57 +321,75 @@ class RecipeDevAPIDemo:
                 }
             ]
             
-            # Add channels to monitoring
-            for channel in demo_channels:
-                try:
-                    # Get channel info first
-                    channel_info = await self.youtube_service.get_channel_info(channel['id'])
-                    
-                    if channel_info:
-                        self.logger.info(
-                            f"✅ Channel found: {channel_info.title} "
-                            f"({channel_info.subscriber_count:,} subscribers)"
-                        )
-                        
-                        # Get recent videos
-                        recent_videos = await self.youtube_service.get_recent_videos(
-                            channel['id'], max_results=5
-                        )
-                        
-                        self.logger.info(f"📹 Found {len(recent_videos)} recent videos")
-                        
-                        for video in recent_videos[:3]:  # Show first 3
-                            duration_min = int(video.duration.total_seconds() / 60)
-                            self.logger.info(
-                                f"  - {video.title} ({duration_min}min, {video.view_count:,} views)"
-                            )
-                        
-                        # Add to Recipe Analyzer monitoring
-                        channel_config = ChannelConfig(
-                            channel_id=channel['id'],
-                            channel_name=channel['name'],
-                            keywords=channel['keywords'],
-                            min_duration=180,  # 3 minutes minimum
-                            max_duration=1800,  # 30 minutes maximum
-                            confidence_threshold=0.7,
-                            meat_recipes_only=False  # Include all recipe types
-                        )
-                        
-                        await self.recipe_analyzer.add_channel(channel_config)
-                        self.logger.info(f"✅ Added {channel['name']} to monitoring")
-                        
-                    else:
-                        self.logger.warning(f"⚠️ Channel not found: {channel['id']}")
-                        
-                except Exception as e:
-                    self.logger.error(f"❌ Error with channel {channel['name']}: {e}")
-                    
-                # Small delay between channels
-                await asyncio.sleep(1)
+            # Fetch channel info and recent videos for all channels in batched requests
+            channel_ids = [channel['id'] for channel in demo_channels]
+            channels_info = await self.youtube_service.get_channels_info(channel_ids)
+            recent_videos_by_channel = await self.youtube_service.get_recent_videos_batch(
+                channel_ids, max_results=5
+            )
+            
+            # Add channels to monitoring concurrently; RateLimiter paces the API calls
+            semaphore = asyncio.Semaphore(5)
+            results = await asyncio.gather(
+                *[
+                    self._process_channel(
+                        channel,
+                        channels_info.get(channel['id']),
+                        recent_videos_by_channel.get(channel['id'], []),
+                        semaphore
+                    )
+                    for channel in demo_channels
+                ],
+                return_exceptions=True
+            )
+            
+            for channel, result in zip(demo_channels, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"❌ Error with channel {channel['name']}: {result}")
             
         except Exception as e:
             self.logger.error(f"❌ YouTube monitoring demo failed: {e}")
     
+    async def _process_channel(
+        self,
+        channel: Dict[str, object],
+        channel_info: Optional[YouTubeChannel],
+        recent_videos: List[YouTubeVideo],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """Report a demo channel and add it to Recipe Analyzer monitoring"""
+        if not channel_info:
+            self.logger.warning(f"⚠️ Channel not found: {channel['id']}")
+            return
+        
+        self.logger.info(
+            f"✅ Channel found: {channel_info.title} "
+            f"({channel_info.subscriber_count:,} subscribers)"
+        )
+        self.logger.info(f"📹 Found {len(recent_videos)} recent videos")
+        
+        for video in recent_videos[:3]:  # Show first 3
+            duration_min = int(video.duration.total_seconds() / 60)
+            self.logger.info(
+                f"  - {video.title} ({duration_min}min, {video.view_count:,} views)"
+            )
+        
+        # Add to Recipe Analyzer monitoring
+        channel_config = ChannelConfig(
+            channel_id=channel['id'],
+            channel_name=channel['name'],
+            keywords=channel['keywords'],
+            min_duration=180,  # 3 minutes minimum
+            max_duration=1800,  # 30 minutes maximum
+            confidence_threshold=0.7,
+            meat_recipes_only=False  # Include all recipe types
+        )
+        
+        # Bound concurrent YouTube lookups to stay within quota
+        async with semaphore:
+            await self.recipe_analyzer.add_channel(channel_config)
+        self.logger.info(f"✅ Added {channel['name']} to monitoring")
+    
     async def demo_claude_analysis(self):
         """Demonstrate Claude recipe analysis"""
         self.logger.info("🤖 Demonstrating Claude recipe analysis...")
@@ -343,7 +440,7 @@ class RecipeDevAPIDemo:
                 try:
                     self.logger.info(f"🔍 Analyzing: {recipe['title']}")
                     
-                    # Analyze with Claude
+                    # Analyze with Claude (repeated recipes are served from the disk cache)
                     analysis = await self.claude_service.analyze_recipe_content(
                         content=recipe['content'],
                         video_title=recipe['title'],
@@ -380,7 +477,6 @@ class RecipeDevAPIDemo:
                     self.logger.error(f"❌ Analysis failed for {recipe['title']}: {e}")
                 
                 print()  # Add spacing
-                await asyncio.sleep(1)
                 
         except Exception as e:
             self.logger.error(f"❌ Claude analysis demo failed: {e}")
@@ -511,24 +607,25 @@ class RecipeDevAPIDemo:
                 }
             ]
             
-            # Send notifications
+            # Send notifications, keeping each one's delivery future
+            deliveries = []
             for notif in notifications:
                 if notif['type'] == 'new_recipe':
-                    notif_id = await self.notification_manager.send_new_recipe_notification(
+                    notif_id, delivery = await self.notification_manager.send_new_recipe_notification(
                         title=notif['title'],
                         channel=notif['channel'],
                         url=notif['url'],
                         description=notif['description']
                     )
                 elif notif['type'] == 'error':
-                    notif_id = await self.notification_manager.send_error_alert(
+                    notif_id, delivery = await self.notification_manager.send_error_alert(
                         error_type=notif['error_type'],
                         api_name=notif['api_name'],
                         message=notif['message'],
                         severity=notif['severity']
                     )
                 elif notif['type'] == 'batch_summary':
-                    notif_id = await self.notification_manager.send_batch_summary(
+                    notif_id, delivery = await self.notification_manager.send_batch_summary(
                         total_count=notif['total_count'],
                         success_count=notif['success_count'],
                         error_count=notif['error_count'],
@@ -536,11 +633,17 @@ class RecipeDevAPIDemo:
                         items=notif['items']
                     )
                 
+                deliveries.append(delivery)
                 self.logger.info(f"📧 Queued notification: {notif_id}")
             
-            # Let notifications process
+            # Wait until every notification is delivered or has failed
             self.logger.info("⏳ Processing notifications...")
-            await asyncio.sleep(5)
+            done, pending = await asyncio.wait(deliveries, timeout=30)
+            delivered = sum(1 for delivery in done if delivery.result())
+            self.logger.info(
+                f"📬 Delivered {delivered}/{len(deliveries)} notifications"
+                + (f" ({len(pending)} still pending)" if pending else "")
+            )
             
             # Get statistics
             stats = self.notification_manager.get_statistics()
@@ -603,39 +706,36 @@ class RecipeDevAPIDemo:
             if not await self.test_api_connections():
                 self.logger.warning("⚠️ Some API connections failed - continuing with available services")
             
-            # Run individual demonstrations
-            await self.demo_youtube_monitoring()
-            print()
-            
-            await self.demo_claude_analysis()
-            print()
-            
-            await self.demo_notion_integration()
-            print()
-            
-            await self.demo_notification_system()
-            print()
+            # Run the independent demonstrations concurrently; each stage's
+            # console output is buffered and printed as one block when it finishes
+            with self._stage_console():
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._run_stage(self.demo_youtube_monitoring))
+                    tg.create_task(self._run_stage(self.demo_claude_analysis))
+                    tg.create_task(self._run_stage(self.demo_notion_integration))
+                    tg.create_task(self._run_stage(self.demo_notification_system))
             
+            # The complete workflow builds on the monitored channels, so it runs last
             await self.demo_complete_workflow()
             print()
             
             # Final statistics
             self.logger.info("📈 Final Statistics:")
             
-            if self.youtube_service:
+            if self._is_started('youtube_service'):
                 youtube_stats = self.youtube_service.get_quota_status()
                 self.logger.info(f"  YouTube Quota: {youtube_stats['quota_used']}/{youtube_stats['quota_limit']}")
             
-            if self.claude_service:
+            if self._is_started('claude_service'):
                 claude_stats = self.claude_service.get_usage_statistics()
                 self.logger.info(f"  Claude Requests: {claude_stats['requests_made']}")
                 self.logger.info(f"  Claude Tokens: {claude_stats['tokens_used']}")
             
-            if self.notion_service:
+            if self._is_started('notion_service'):
                 notion_stats = self.notion_service.get_usage_statistics()
                 self.logger.info(f"  Notion Pages: {notion_stats['pages_created']} created")
             
-            if self.gmail_service:
+            if self._is_started('gmail_service'):
                 gmail_stats = self.gmail_service.get_usage_statistics()
                 self.logger.info(f"  Emails Sent: {gmail_stats['emails_sent']}")
             
@@ -645,6 +745,79 @@ class RecipeDevAPIDemo:
         except Exception as e:
             self.logger.error(f"❌ Demo failed: {e}")
             return False
+        finally:
+            await self.http.aclose()
+    
+    async def _run_stage(self, stage: Callable[[], Awaitable[None]]) -> None:
+        """Run a demo stage with its console output collected in private buffers"""
+        buffers = {'stdout': io.StringIO(), 'stderr': io.StringIO()}
+        _stage_buffers.set(buffers)  # Tasks run in a copy of the context
+        
+        try:
+            await stage()
+        finally:
+            output = {channel: buffer.getvalue() for channel, buffer in buffers.items()}
+            # Closed buffers make later writes (e.g. from background tasks the
+            # stage started) bypass the buffer instead of being lost
+            for buffer in buffers.values():
+                buffer.close()
+            
+            # No await between the writes, so blocks from other stages cannot interleave
+            sys.stdout.write(output['stdout'])
+            print()
+            sys.stdout.flush()
+            sys.stderr.write(output['stderr'])
+    
+    @contextmanager
+    def _stage_console(self):
+        """Route stdout and console log output through the per-stage buffers"""
+        channels = {id(sys.stdout): 'stdout', id(sys.stderr): 'stderr'}
+        root_logger = logging.getLogger()
+        console_handlers = [
+            handler for handler in root_logger.handlers
+            if type(handler) is logging.StreamHandler and id(handler.stream) in channels
+        ]
+        previous_streams = [
+            (handler, handler.setStream(_StageConsole(handler.stream, channels[id(handler.stream)])))
+            for handler in console_handlers
+        ]
+        
+        try:
+            with redirect_stdout(_StageConsole(sys.stdout, 'stdout')):
+                yield
+        finally:
+            for handler, stream in previous_streams:
+                handler.setStream(stream)
+
+
+def _io_uring_supported() -> bool:
+    """Check whether the running kernel provides the io_uring features uringcore needs (Linux 5.11+)"""
+    if platform.system() != 'Linux':
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split('.')[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 11)
+
+
+def _install_event_loop_policy() -> str:
+    """
+    Install the fastest available event loop policy
+    
+    Prefers uringcore on Linux 5.11+, then uvloop, and otherwise keeps
+    asyncio's default loop.
+    
+    Returns:
+        Name of the event loop in use
+    """
+    if uringcore and _io_uring_supported():
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+        return 'uringcore'
+    if uvloop:
+        uvloop.install()
+        return 'uvloop'
+    return 'asyncio'
 
 
 async def main():
@@ -685,6 +858,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    # The loop policy must be set before asyncio.run creates the loop
+    _install_event_loop_policy()
+    
     # Run the demonstration
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
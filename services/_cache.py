@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Call Caching Helpers
+Recipe-DevAPI Agent
+
+This module provides decorators that avoid repeating identical API calls
+made by the service classes.
+"""
+
+import asyncio
+import functools
+import inspect
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Awaitable, Hashable, Optional, Tuple
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert call arguments into a hashable key component"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def coalesce(key: Optional[Callable[..., Hashable]] = None):
+    """
+    Decorator sharing one in-flight call between identical concurrent callers
+    
+    While a call is pending, later callers with the same key await its result
+    (or exception) instead of issuing a duplicate request. The call runs as
+    its own task, so cancelling any caller, the first one included, does not
+    cancel it for the others. The entry is dropped as soon as the call
+    finishes, so nothing is cached afterwards. The decorated method's
+    instance must provide an `_inflight` dict.
+    
+    Args:
+        key: Optional function of the call arguments (without self) returning
+            the coalescing key; by default the bound arguments, with defaults
+            applied, form the key
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+        
+        def make_key(self, args, kwargs) -> Hashable:
+            if key is not None:
+                return func.__name__, key(*args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return func.__name__, _freeze(list(bound.arguments.values())[1:])
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> Any:
+            call_key = make_key(self, args, kwargs)
+            inflight = self._inflight
+            
+            task = inflight.get(call_key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, *args, **kwargs))
+                inflight[call_key] = task
+                
+                def finished(done: asyncio.Future) -> None:
+                    if inflight.get(call_key) is done:
+                        del inflight[call_key]
+                    if not done.cancelled():
+                        done.exception()  # Retrieved here so a failure nobody awaits is not logged
+                
+                task.add_done_callback(finished)
+            
+            # Shielded so a cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+        
+        return wrapper
+    return decorator
+
+
+class DiskCache:
+    """
+    Persistent key-value store with per-entry expiry, backed by SQLite
+    
+    Values are pickled, so any result object the services return can be
+    stored. Operations are short local queries and run synchronously.
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path: SQLite database file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL)"
+        )
+        self._db.commit()
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up an entry
+        
+        Returns:
+            Tuple[bool, Any]: (hit, value); expired or unreadable entries are misses
+        """
+        row = self._db.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return False, None
+        
+        try:
+            return True, pickle.loads(row[0])
+        except Exception:
+            # Written by an incompatible version of the cached class
+            return False, None
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store an entry
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds, or None to keep the entry indefinitely
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._db:
+            # Expired entries are never read again, so prune them as we write
+            self._db.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, pickle.dumps(value), expires_at)
+            )
+    
+    def close(self) -> None:
+        """Close the cache database"""
+        self._db.close()
+
+
+def acache(
+    ttl: Optional[int],
+    key: Callable[..., Optional[str]],
+    cacheable: Callable[[Any], bool] = lambda result: result is not None
+):
+    """
+    Decorator persisting an async method's results in the instance's disk cache
+    
+    The decorated method's instance must provide a `_disk_cache` attribute
+    (a DiskCache, or None to disable caching).
+    
+    Args:
+        ttl: Entry lifetime in seconds, or None to keep entries indefinitely
+        key: Function called with the bound call arguments (without self, as
+            keyword arguments) returning the cache key, or None to bypass the cache
+        cacheable: Predicate deciding whether a result may be stored
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> Any:
+            cache = self._disk_cache
+            if cache is None:
+                return await func(self, *args, **kwargs)
+            
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments[next(iter(signature.parameters))]
+            
+            cache_key = key(**arguments)
+            if cache_key is None:
+                return await func(self, *args, **kwargs)
+            
+            hit, value = cache.get(cache_key)
+            if hit:
+                return value
+            
+            result = await func(self, *args, **kwargs)
+            if cacheable(result):
+                cache.set(cache_key, result, ttl)
+            return result
+        
+        return wrapper
+    return decorator
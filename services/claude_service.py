@@ -9,8 +9,11 @@ translation, content generation, and meat dish detection.
 """
 
 import asyncio
+import hashlib
 import logging
 import time
+import unicodedata
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -19,12 +22,13 @@ import json
 import re
 
 import httpx
-from anthropic import AsyncAnthropic
+from anthropic import AsyncAnthropic, DEFAULT_TIMEOUT
 from anthropic.types import Message, TextBlock
 
 from config.rate_limiter import RateLimiter, APIRateLimitDecorator
 from config.error_handler import APIErrorHandler, handle_api_errors
 from config.logger_config import get_api_logger
+from services._cache import DiskCache, acache, coalesce
 
 
 class RecipeType(Enum):
@@ -92,6 +96,7 @@ class RecipeAnalysis:
             'source_language': self.source_language,
             'analysis_timestamp': self.analysis_timestamp.isoformat()
         }
+    
 
 
 @dataclass
@@ -106,6 +111,30 @@ class TranslationResult:
     cooking_context: bool = False
 
 
+def _normalize_content(text: str) -> str:
+    """Normalize text for exact-match caching (Unicode form and whitespace only)"""
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+def _analysis_disk_key(
+    content: str,
+    video_title: str,
+    video_description: str,
+    analysis_types: Optional[List[AnalysisType]]
+) -> str:
+    """
+    Disk cache key for an analysis
+    
+    Hash of the full normalized input plus the analysis types, so only
+    identical recipes (ignoring whitespace and Unicode form) share an entry.
+    """
+    digest = hashlib.sha256(
+        '\0'.join(map(_normalize_content, (content, video_title, video_description))).encode('utf-8')
+    ).hexdigest()
+    types = ','.join(sorted(t.value for t in analysis_types)) if analysis_types else 'default'
+    return f"claude:{digest}:{types}"
+
+
 class ClaudeService:
     """
     Comprehensive Claude API service for recipe analysis and translation
@@ -125,7 +154,9 @@ class ClaudeService:
         api_key: str,
         rate_limiter: RateLimiter,
         error_handler: APIErrorHandler,
-        model: str = "claude-3-5-sonnet-20241022"
+        model: str = "claude-3-5-sonnet-20241022",
+        cache_dir: Optional[Path] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Claude service
@@ -135,6 +166,8 @@ class ClaudeService:
             rate_limiter: Rate limiting manager
             error_handler: Error handling manager
             model: Claude model to use
+            cache_dir: Optional directory for the persistent analysis cache
+            http_client: Optional shared HTTP client (connection pool) for API calls
         """
         self.api_key = api_key
         self.rate_limiter = rate_limiter
@@ -142,13 +175,20 @@ class ClaudeService:
         self.model = model
         self.logger = get_api_logger('claude')
         
-        # Initialize Claude client
-        self.client = AsyncAnthropic(api_key=api_key)
+        # Initialize Claude client; the SDK timeout is set explicitly because
+        # an injected client's own (shorter) timeout would otherwise replace it
+        self.client = AsyncAnthropic(api_key=api_key, http_client=http_client, timeout=DEFAULT_TIMEOUT)
         
         # Analysis cache
         self._analysis_cache: Dict[str, Tuple[Any, float]] = {}
         self.cache_ttl = 3600  # 1 hour
         
+        # Persistent analysis cache, reused across runs
+        self._disk_cache = DiskCache(cache_dir / "claude_cache.db") if cache_dir else None
+        
+        # Pending calls shared between identical concurrent callers (see coalesce)
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        
         # Token usage tracking
         self.tokens_used = 0
         self.requests_made = 0
@@ -208,6 +248,12 @@ class ClaudeService:
         }
     
     @handle_api_errors(None, 'claude', 'analyze_recipe_content')
+    @coalesce()
+    @acache(
+        ttl=None,  # Analyses of identical input never change
+        key=_analysis_disk_key,
+        cacheable=lambda analysis: analysis.recipe_type is not RecipeType.UNKNOWN
+    )
     async def analyze_recipe_content(
         self,
         content: str,
@@ -242,6 +288,7 @@ class ClaudeService:
             self.logger.debug("Using cached recipe analysis")
             return cached_result
         
+        await self.rate_limiter.claude.acquire(1)  # messages.create counts as 1 request
         await self.rate_limiter.wait_if_needed('claude', 'recipe_analysis')
         
         try:
@@ -455,6 +502,7 @@ class ClaudeService:
         Returns:
             TranslationResult object
         """
+        await self.rate_limiter.claude.acquire(1)  # messages.create counts as 1 request
         await self.rate_limiter.wait_if_needed('claude', 'translation')
         
         try:
@@ -11,7 +11,7 @@ HTML email notifications, and error reporting capabilities.
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -28,6 +28,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from google_auth_httplib2 import AuthorizedHttp
 
 from config.rate_limiter import RateLimiter, APIRateLimitDecorator
 from config.error_handler import APIErrorHandler, handle_api_errors
@@ -101,13 +103,17 @@ class GmailService:
     - Attachment support
     """
     
+    # Gmail recommends at most 50 calls per batch request
+    BATCH_SIZE = 50
+    
     def __init__(
         self,
         credentials: Optional[Credentials],
         rate_limiter: RateLimiter,
         error_handler: APIErrorHandler,
         config_dir: Path,
-        sender_email: Optional[str] = None
+        sender_email: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Gmail service
@@ -118,12 +124,14 @@ class GmailService:
             error_handler: Error handling manager
             config_dir: Configuration directory
             sender_email: Sender email address
+            http_client: Optional shared HTTP client for downloading URL attachments
         """
         self.credentials = credentials
         self.rate_limiter = rate_limiter
         self.error_handler = error_handler
         self.config_dir = config_dir
         self.sender_email = sender_email
+        self.http_client = http_client
         self.logger = get_api_logger('gmail')
         
         # Gmail service
@@ -408,57 +416,13 @@ class GmailService:
         if not self.service:
             raise ValueError("Gmail service not initialized - missing credentials")
         
+        await self.rate_limiter.gmail.acquire(100)  # messages.send costs 100 quota units
         await self.rate_limiter.wait_if_needed('gmail', 'send_message')
         
         try:
-            # Build email message
-            if template_id and template_id in self.templates:
-                email_content = await self._render_template(
-                    template_id, template_variables or {}
-                )
-                subject = await self._render_string(
-                    self.templates[template_id].subject, 
-                    template_variables or {}
-                )
-            else:
-                email_content = message.html_content
-                subject = message.subject
-            
-            # Create MIME message
-            msg = MimeMultipart('alternative')
-            
-            # Set headers
-            msg['Subject'] = subject
-            msg['From'] = self.sender_email or 'noreply@recipemonitor.com'
-            msg['To'] = ', '.join([r.email for r in message.recipients if r.type == 'to'])
-            
-            if any(r.type == 'cc' for r in message.recipients):
-                msg['Cc'] = ', '.join([r.email for r in message.recipients if r.type == 'cc'])
-            
-            if message.reply_to:
-                msg['Reply-To'] = message.reply_to
-            
-            # Add text content if available
-            if message.text_content:
-                text_part = MimeText(message.text_content, 'plain', 'utf-8')
-                msg.attach(text_part)
-            
-            # Add HTML content
-            html_part = MimeText(email_content, 'html', 'utf-8')
-            msg.attach(html_part)
-            
-            # Add attachments
-            for attachment in message.attachments:
-                await self._add_attachment(msg, attachment)
-            
-            # Encode message for Gmail API
-            raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode('utf-8')
-            
-            # Send via Gmail API
-            api_message = {
-                'raw': raw_message,
-                'threadId': None
-            }
+            subject, api_message = await self._build_api_message(
+                message, template_id, template_variables
+            )
             
             result = self.service.users().messages().send(
                 userId='me',
@@ -484,6 +448,141 @@ class GmailService:
             self.logger.error(f"Unexpected error sending email: {e}")
             raise
     
+    async def send_batch(
+        self,
+        messages: List[Tuple[EmailMessage, Optional[str], Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several emails through Gmail batch requests
+        
+        Up to BATCH_SIZE messages.send calls share a single HTTP request.
+        Each chunk is sent independently: if one fails, only its messages
+        that got no response are reported as failed, and later chunks are
+        still sent.
+        
+        Args:
+            messages: (message, template_id, template_variables) tuples, as for send_email
+            
+        Returns:
+            Send results in input order; failed messages have success False and an error
+        """
+        if not self.service:
+            raise ValueError("Gmail service not initialized - missing credentials")
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        
+        def collect(request_id: str, response: Dict[str, Any], exception: Optional[HttpError]) -> None:
+            index = int(request_id)
+            if exception is not None:
+                self.logger.error(f"Gmail API error sending batched email: {exception}")
+                results[index] = {'success': False, 'error': str(exception)}
+            else:
+                results[index] = {
+                    'success': True,
+                    'message_id': response.get('id'),
+                    'thread_id': response.get('threadId'),
+                    'label_ids': response.get('labelIds', [])
+                }
+        
+        for start in range(0, len(messages), self.BATCH_SIZE):
+            end = min(start + self.BATCH_SIZE, len(messages))
+            
+            try:
+                batch = self.service.new_batch_http_request(callback=collect)
+                
+                for index in range(start, end):
+                    _, api_message = await self._build_api_message(*messages[index])
+                    await self.rate_limiter.gmail.acquire(100)  # messages.send costs 100 quota units
+                    batch.add(
+                        self.service.users().messages().send(userId='me', body=api_message),
+                        request_id=str(index)
+                    )
+                
+                await self.rate_limiter.wait_if_needed('gmail', 'send_batch')
+                
+                # Runs in a worker thread with its own authorized connection,
+                # since the shared client's transport is not thread-safe
+                await asyncio.to_thread(
+                    batch.execute, http=AuthorizedHttp(self.credentials, http=build_http())
+                )
+                self.requests_made += 1
+                
+            except Exception as e:
+                self.logger.error(f"Error sending email batch {start}-{end - 1}: {e}")
+                await self.error_handler.handle_error(e, 'gmail', 'send_batch')
+                # Messages whose callback already ran keep their result
+                for index in range(start, end):
+                    if results[index] is None:
+                        results[index] = {'success': False, 'error': str(e)}
+        
+        sent = sum(1 for result in results if result['success'])
+        self.emails_sent += sent
+        
+        self.logger.info(f"Batch sent {sent}/{len(messages)} emails")
+        return results
+    
+    async def _build_api_message(
+        self,
+        message: EmailMessage,
+        template_id: Optional[str] = None,
+        template_variables: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the Gmail API message body for an email
+        
+        Returns:
+            Tuple of the rendered subject and the messages.send request body
+        """
+        # Build email message
+        if template_id and template_id in self.templates:
+            email_content = await self._render_template(
+                template_id, template_variables or {}
+            )
+            subject = await self._render_string(
+                self.templates[template_id].subject, 
+                template_variables or {}
+            )
+        else:
+            email_content = message.html_content
+            subject = message.subject
+        
+        # Create MIME message
+        msg = MimeMultipart('alternative')
+        
+        # Set headers
+        msg['Subject'] = subject
+        msg['From'] = self.sender_email or 'noreply@recipemonitor.com'
+        msg['To'] = ', '.join([r.email for r in message.recipients if r.type == 'to'])
+        
+        if any(r.type == 'cc' for r in message.recipients):
+            msg['Cc'] = ', '.join([r.email for r in message.recipients if r.type == 'cc'])
+        
+        if message.reply_to:
+            msg['Reply-To'] = message.reply_to
+        
+        # Add text content if available
+        if message.text_content:
+            text_part = MimeText(message.text_content, 'plain', 'utf-8')
+            msg.attach(text_part)
+        
+        # Add HTML content
+        html_part = MimeText(email_content, 'html', 'utf-8')
+        msg.attach(html_part)
+        
+        # Add attachments
+        for attachment in message.attachments:
+            await self._add_attachment(msg, attachment)
+        
+        # Encode message for Gmail API
+        raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode('utf-8')
+        
+        api_message = {
+            'raw': raw_message,
+            'threadId': None
+        }
+        
+        return subject, api_message
+    
     async def _render_template(
         self, 
         template_id: str, 
@@ -561,25 +660,29 @@ class GmailService:
             
             elif attachment_type == 'url':
                 # URL-based attachment (download first)
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(attachment['url'])
-                    if response.status_code == 200:
-                        content_type = response.headers.get('content-type', 'application/octet-stream')
-                        
-                        if content_type.startswith('image/'):
-                            mime_attachment = MimeImage(response.content)
-                        else:
-                            from email.mime.application import MimeApplication
-                            mime_attachment = MimeApplication(response.content)
-                        
-                        filename = attachment.get('filename', 'attachment')
-                        mime_attachment.add_header(
-                            'Content-Disposition',
-                            'attachment',
-                            filename=filename
-                        )
-                        
-                        msg.attach(mime_attachment)
+                if self.http_client is not None:
+                    response = await self.http_client.get(attachment['url'])
+                else:
+                    async with httpx.AsyncClient() as client:
+                        response = await client.get(attachment['url'])
+                
+                if response.status_code == 200:
+                    content_type = response.headers.get('content-type', 'application/octet-stream')
+                    
+                    if content_type.startswith('image/'):
+                        mime_attachment = MimeImage(response.content)
+                    else:
+                        from email.mime.application import MimeApplication
+                        mime_attachment = MimeApplication(response.content)
+                    
+                    filename = attachment.get('filename', 'attachment')
+                    mime_attachment.add_header(
+                        'Content-Disposition',
+                        'attachment',
+                        filename=filename
+                    )
+                    
+                    msg.attach(mime_attachment)
             
         except Exception as e:
             self.logger.error(f"Error adding attachment: {e}")
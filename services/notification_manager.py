@@ -10,7 +10,7 @@ including batching, prioritization, and multi-channel delivery.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Dict, List, Optional, Any, Callable, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -18,6 +18,8 @@ from pathlib import Path
 import json
 import time
 
+import httpx
+
 from .gmail_service import GmailService, EmailRecipient, NotificationType, EmailMessage
 from config.error_handler import APIErrorHandler
 from config.logger_config import get_api_logger
@@ -53,6 +55,8 @@ class NotificationPayload:
     scheduled_for: Optional[datetime] = None
     retry_count: int = 0
     max_retries: int = 3
+    # Resolved with True when delivered, or False once delivery has failed for good
+    delivery: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -106,7 +110,8 @@ class NotificationManager:
         self,
         gmail_service: GmailService,
         error_handler: APIErrorHandler,
-        config_dir: Path
+        config_dir: Path,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Notification Manager
@@ -115,10 +120,12 @@ class NotificationManager:
             gmail_service: Gmail service for email notifications
             error_handler: Error handling service
             config_dir: Configuration directory
+            http_client: Optional shared HTTP client for webhook delivery
         """
         self.gmail_service = gmail_service
         self.error_handler = error_handler
         self.config_dir = config_dir
+        self.http_client = http_client
         self.logger = get_api_logger('notification_manager')
         
         # Notification queues by priority
@@ -132,6 +139,7 @@ class NotificationManager:
         # Processing state
         self.processing_active = False
         self.processing_task: Optional[asyncio.Task] = None
+        self._work_available = asyncio.Event()  # Wakes an idle processing loop
         
         # Configuration
         self.rules: Dict[str, NotificationRule] = {}
@@ -227,7 +235,7 @@ class NotificationManager:
         channels: Optional[List[NotificationChannel]] = None,
         recipients: Optional[List[EmailRecipient]] = None,
         scheduled_for: Optional[datetime] = None
-    ) -> str:
+    ) -> Tuple[str, asyncio.Future]:
         """
         Send a notification
         
@@ -242,7 +250,8 @@ class NotificationManager:
             scheduled_for: Schedule for future delivery
             
         Returns:
-            Notification ID
+            Tuple of the notification ID and a future resolved with the
+            delivery outcome (True if delivered, False if it failed or was dropped)
         """
         try:
             # Generate notification ID
@@ -258,21 +267,27 @@ class NotificationManager:
                 data=data or {},
                 channels=channels or [NotificationChannel.EMAIL],
                 recipients=recipients or self.default_recipients,
-                scheduled_for=scheduled_for
+                scheduled_for=scheduled_for,
+                delivery=asyncio.get_running_loop().create_future()
             )
+            delivery = notification.delivery
             
             # Apply rules
             notification = await self._apply_rules(notification)
+            if notification is None:
+                delivery.set_result(False)
+                return notification_id, delivery
             
             # Add to appropriate queue
             self.queues[notification.priority].append(notification)
+            self._work_available.set()
             
             # Start processing if not active
             if not self.processing_active:
                 await self.start_processing()
             
             self.logger.info(f"Queued notification: {title} (ID: {notification_id}, Priority: {priority.value})")
-            return notification_id
+            return notification_id, delivery
             
         except Exception as e:
             self.logger.error(f"Error sending notification: {e}")
@@ -363,19 +378,27 @@ class NotificationManager:
         """Main notification processing loop"""
         try:
             while self.processing_active:
-                # Process queues in priority order
-                processed_any = False
+                # Cleared before the queues are checked so no new notification is missed
+                self._work_available.clear()
                 
+                # Collect due notifications in priority order
+                ready = []
                 for priority in [Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM, Priority.LOW]:
-                    if await self._process_queue(priority):
-                        processed_any = True
+                    ready.extend(self._take_ready(priority))
+                
+                if ready:
+                    await self._deliver_ready(ready)
                 
                 # Reset rate limits if needed
                 self._reset_rate_limits()
                 
                 # Wait before next cycle
-                if not processed_any:
-                    await asyncio.sleep(10)  # Wait longer if no notifications processed
+                if not ready:
+                    # Wait longer if no notifications processed, unless one gets queued
+                    try:
+                        await asyncio.wait_for(self._work_available.wait(), 10)
+                    except asyncio.TimeoutError:
+                        pass
                 else:
                     await asyncio.sleep(1)   # Quick cycle if processing notifications
                     
@@ -385,27 +408,45 @@ class NotificationManager:
             self.logger.error(f"Error in notification processing loop: {e}")
             await self.error_handler.handle_error(e, 'notification_manager', 'processing_loop')
     
-    async def _process_queue(self, priority: Priority) -> bool:
-        """Process notifications from a specific priority queue"""
+    def _take_ready(self, priority: Priority) -> List[NotificationPayload]:
+        """Remove and return the due notifications of a priority queue, within its rate limit"""
         queue = self.queues[priority]
-        if not queue:
-            return False
+        if not queue or not self._check_rate_limit(priority):
+            return []
         
-        # Check rate limits
-        if not self._check_rate_limit(priority):
-            return False
+        limit_info = self.rate_limits[priority]
+        allowance = limit_info['max_per_hour'] - limit_info['current']
+        now = datetime.now()
         
-        # Get next notification
-        notification = queue.pop(0)
+        ready = []
+        waiting = []
+        for notification in queue:
+            # Notifications scheduled for the future stay queued for later
+            if len(ready) < allowance and not (
+                notification.scheduled_for and now < notification.scheduled_for
+            ):
+                ready.append(notification)
+            else:
+                waiting.append(notification)
         
-        # Check if scheduled for future
-        if notification.scheduled_for and datetime.now() < notification.scheduled_for:
-            # Put back in queue for later
-            queue.append(notification)
-            return False
+        queue[:] = waiting
+        return ready
+    
+    async def _deliver_ready(self, notifications: List[NotificationPayload]) -> None:
+        """Deliver a cycle's notifications, sending all of their emails in one batch"""
+        email_notifications = [
+            n for n in notifications if NotificationChannel.EMAIL in n.channels
+        ]
+        email_results = await self._deliver_email_batch(email_notifications)
+        email_sent = dict(zip(map(id, email_notifications), email_results))
         
-        # Process notification
-        success = await self._deliver_notification(notification)
+        for notification in notifications:
+            success = await self._deliver_notification(notification, email_sent.get(id(notification)))
+            self._record_outcome(notification, success)
+    
+    def _record_outcome(self, notification: NotificationPayload, success: bool) -> None:
+        """Update statistics and history, or schedule a retry, after a delivery attempt"""
+        priority = notification.priority
         
         if success:
             # Update statistics
@@ -419,6 +460,8 @@ class NotificationManager:
             # Update rate limit
             self.rate_limits[priority]['current'] += 1
             
+            self._resolve_delivery(notification, True)
+            
         else:
             # Handle failure
             notification.retry_count += 1
@@ -427,7 +470,7 @@ class NotificationManager:
                 # Schedule retry with exponential backoff
                 delay_minutes = 2 ** notification.retry_count  # 2, 4, 8 minutes
                 notification.scheduled_for = datetime.now() + timedelta(minutes=delay_minutes)
-                queue.append(notification)
+                self.queues[priority].append(notification)
                 
                 self.stats['retry_attempts'] += 1
                 self.logger.warning(
@@ -438,21 +481,38 @@ class NotificationManager:
                 # Max retries exceeded
                 self.stats['failed_notifications'] += 1
                 self._add_to_history(notification, success=False, error="Max retries exceeded")
+                self._resolve_delivery(notification, False)
                 
                 self.logger.error(
                     f"Notification delivery failed permanently: {notification.title}"
                 )
-        
-        return True
     
-    async def _deliver_notification(self, notification: NotificationPayload) -> bool:
-        """Deliver notification through configured channels"""
+    def _resolve_delivery(self, notification: NotificationPayload, delivered: bool) -> None:
+        """Report the final delivery outcome to whoever awaits the notification"""
+        if notification.delivery and not notification.delivery.done():
+            notification.delivery.set_result(delivered)
+    
+    async def _deliver_notification(
+        self,
+        notification: NotificationPayload,
+        email_sent: Optional[bool] = None
+    ) -> bool:
+        """
+        Deliver notification through configured channels
+        
+        Args:
+            notification: Notification to deliver
+            email_sent: Outcome of an email already sent in a batch, if any
+        """
         delivery_success = True
         
         for channel in notification.channels:
             try:
                 if channel == NotificationChannel.EMAIL:
-                    success = await self._deliver_email(notification)
+                    if email_sent is None:
+                        success = await self._deliver_email(notification)
+                    else:
+                        success = email_sent
                 elif channel == NotificationChannel.WEBHOOK:
                     success = await self._deliver_webhook(notification)
                 elif channel == NotificationChannel.CONSOLE:
@@ -474,48 +534,77 @@ class NotificationManager:
         
         return delivery_success
     
+    def _email_request(
+        self,
+        notification: NotificationPayload
+    ) -> Tuple[EmailMessage, Optional[str], Optional[Dict[str, Any]]]:
+        """Build the (message, template_id, template_variables) email for a notification"""
+        # Map notification types to email templates
+        template_mapping = {
+            'new_recipe': NotificationType.NEW_RECIPE,
+            'error_alert': NotificationType.ERROR_ALERT,
+            'system_status': NotificationType.SYSTEM_STATUS,
+            'batch_summary': NotificationType.BATCH_SUMMARY
+        }
+        
+        template_id = template_mapping.get(notification.type)
+        
+        message = EmailMessage(
+            recipients=notification.recipients,
+            subject=notification.title,
+            html_content=notification.message,
+            text_content=notification.message
+        )
+        
+        if template_id:
+            # Use template
+            return message, template_id, notification.data
+        
+        # Send as plain email
+        return message, None, None
+    
     async def _deliver_email(self, notification: NotificationPayload) -> bool:
         """Deliver notification via email"""
         try:
-            # Map notification types to email templates
-            template_mapping = {
-                'new_recipe': NotificationType.NEW_RECIPE,
-                'error_alert': NotificationType.ERROR_ALERT,
-                'system_status': NotificationType.SYSTEM_STATUS,
-                'batch_summary': NotificationType.BATCH_SUMMARY
-            }
-            
-            template_id = template_mapping.get(notification.type)
-            
-            message = EmailMessage(
-                recipients=notification.recipients,
-                subject=notification.title,
-                html_content=notification.message,
-                text_content=notification.message
+            message, template_id, template_variables = self._email_request(notification)
+            result = await self.gmail_service.send_email(
+                message=message,
+                template_id=template_id,
+                template_variables=template_variables
             )
             
-            if template_id:
-                # Use template
-                result = await self.gmail_service.send_email(
-                    message=message,
-                    template_id=template_id,
-                    template_variables=notification.data
-                )
-            else:
-                # Send as plain email
-                result = await self.gmail_service.send_email(message)
-            
             return result.get('success', False)
             
         except Exception as e:
             self.logger.error(f"Error delivering email notification: {e}")
             return False
     
+    async def _deliver_email_batch(self, notifications: List[NotificationPayload]) -> List[bool]:
+        """
+        Deliver several notifications via email in one Gmail batch request
+        
+        Falls back to individual sends when batching is disabled in the Gmail
+        notification configuration or there is only one email to send.
+        Outcomes are per message, so only emails Gmail did not accept are
+        retried.
+        """
+        if len(notifications) < 2 or not self.gmail_service.notification_config.batch_notifications:
+            return [await self._deliver_email(notification) for notification in notifications]
+        
+        try:
+            results = await self.gmail_service.send_batch(
+                [self._email_request(notification) for notification in notifications]
+            )
+            return [result.get('success', False) for result in results]
+            
+        except Exception as e:
+            # send_batch only raises before anything has been sent
+            self.logger.error(f"Error delivering email notification batch: {e}")
+            return [False] * len(notifications)
+    
     async def _deliver_webhook(self, notification: NotificationPayload) -> bool:
         """Deliver notification via webhook"""
         try:
-            import httpx
-            
             webhook_payload = {
                 'id': notification.notification_id,
                 'type': notification.type,
@@ -527,34 +616,41 @@ class NotificationManager:
             }
             
             # Send to all configured webhooks
-            success = True
-            for webhook_name, webhook_url in self.webhooks.items():
-                try:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.post(
-                            webhook_url,
-                            json=webhook_payload,
-                            headers={'Content-Type': 'application/json'},
-                            timeout=30
-                        )
-                        
-                        if response.status_code not in [200, 201, 202]:
-                            self.logger.error(
-                                f"Webhook {webhook_name} returned {response.status_code}: "
-                                f"{response.text}"
-                            )
-                            success = False
-                        
-                except Exception as e:
-                    self.logger.error(f"Error sending webhook {webhook_name}: {e}")
-                    success = False
+            if self.http_client is not None:
+                return await self._post_webhooks(self.http_client, webhook_payload)
             
-            return success
+            async with httpx.AsyncClient() as client:
+                return await self._post_webhooks(client, webhook_payload)
             
         except Exception as e:
             self.logger.error(f"Error delivering webhook notification: {e}")
             return False
     
+    async def _post_webhooks(self, client: httpx.AsyncClient, webhook_payload: Dict[str, Any]) -> bool:
+        """Post a payload to every configured webhook over one client"""
+        success = True
+        for webhook_name, webhook_url in self.webhooks.items():
+            try:
+                response = await client.post(
+                    webhook_url,
+                    json=webhook_payload,
+                    headers={'Content-Type': 'application/json'},
+                    timeout=30
+                )
+                
+                if response.status_code not in [200, 201, 202]:
+                    self.logger.error(
+                        f"Webhook {webhook_name} returned {response.status_code}: "
+                        f"{response.text}"
+                    )
+                    success = False
+                
+            except Exception as e:
+                self.logger.error(f"Error sending webhook {webhook_name}: {e}")
+                success = False
+        
+        return success
+    
     async def _deliver_console(self, notification: NotificationPayload) -> bool:
         """Deliver notification via console output"""
         try:
@@ -633,7 +729,7 @@ class NotificationManager:
         url: str,
         description: str,
         thumbnail_url: Optional[str] = None
-    ) -> str:
+    ) -> Tuple[str, asyncio.Future]:
         """Send new recipe notification"""
         return await self.send_notification(
             notification_type='new_recipe',
@@ -656,7 +752,7 @@ class NotificationManager:
         message: str,
         details: Optional[str] = None,
         severity: str = 'medium'
-    ) -> str:
+    ) -> Tuple[str, asyncio.Future]:
         """Send error alert notification"""
         priority_map = {
             'low': Priority.LOW,
@@ -686,7 +782,7 @@ class NotificationManager:
         error_count: int,
         duration: float,
         items: List[str]
-    ) -> str:
+    ) -> Tuple[str, asyncio.Future]:
         """Send batch processing summary"""
         return await self.send_notification(
             notification_type='batch_summary',
@@ -764,22 +860,22 @@ async def example_usage():
     await notification_manager.start_processing()
     
     # Send various types of notifications
-    await notification_manager.send_new_recipe_notification(
+    _, recipe_delivery = await notification_manager.send_new_recipe_notification(
         title="Amazing Pasta Carbonara",
         channel="Italian Cooking",
         url="https://youtube.com/watch?v=example",
         description="Learn to make authentic carbonara"
     )
     
-    await notification_manager.send_error_alert(
+    _, alert_delivery = await notification_manager.send_error_alert(
         error_type="API Error",
         api_name="YouTube",
         message="Rate limit exceeded",
         severity="high"
     )
     
-    # Let it process for a bit
-    await asyncio.sleep(5)
+    # Wait for delivery (failed attempts are retried minutes later, hence the timeout)
+    await asyncio.wait([recipe_delivery, alert_delivery], timeout=30)
     
     # Get statistics
     stats = notification_manager.get_statistics()
@@ -215,6 +215,7 @@ class NotionService:
             if time.time() - timestamp < self.cache_ttl:
                 return NotionDatabase(**cached_data)
         
+        await self.rate_limiter.notion.acquire(1)  # databases.retrieve counts as 1 request
         await self.rate_limiter.wait_if_needed('notion', 'retrieve_database')
         
         try:
@@ -265,6 +266,7 @@ class NotionService:
         """
         db_id = database_id or self.database_id
         
+        await self.rate_limiter.notion.acquire(1)  # pages.create counts as 1 request
         await self.rate_limiter.wait_if_needed('notion', 'create_page')
         
         try:
@@ -522,6 +524,7 @@ class NotionService:
         Returns:
             Updated NotionPage object
         """
+        await self.rate_limiter.notion.acquire(1)  # pages.update counts as 1 request
         await self.rate_limiter.wait_if_needed('notion', 'update_page')
         
         try:
@@ -534,6 +537,7 @@ class NotionService:
             
             # Append content blocks if provided
             if append_content:
+                await self.rate_limiter.notion.acquire(1)  # blocks.children.append counts as 1 request
                 await self.rate_limiter.wait_if_needed('notion', 'append_blocks')
                 
                 await self.client.blocks.children.append(
@@ -578,6 +582,7 @@ class NotionService:
         """
         db_id = database_id or self.database_id
         
+        await self.rate_limiter.notion.acquire(1)  # databases.query counts as 1 request
         await self.rate_limiter.wait_if_needed('notion', 'query_database')
         
         try:
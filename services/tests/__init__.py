@@ -0,0 +1 @@
+# Service Tests Package
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Call Caching Helper Tests
+Recipe-DevAPI Agent
+
+Tests for the coalesce decorator and DiskCache in services/_cache.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from services._cache import DiskCache, coalesce
+
+
+class SlowService:
+    """Service stub whose call blocks until released"""
+
+    def __init__(self):
+        self._inflight = {}
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    @coalesce()
+    async def fetch(self, item_id: str) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return f"result:{item_id}"
+
+
+class TestCoalesce:
+    """coalesce decorator tests"""
+
+    def test_identical_calls_share_one_request(self):
+        """Concurrent identical calls run the wrapped method once"""
+        async def scenario():
+            service = SlowService()
+            first = asyncio.create_task(service.fetch("a"))
+            second = asyncio.create_task(service.fetch("a"))
+            await asyncio.sleep(0)
+            service.release.set()
+            return service, await asyncio.gather(first, second)
+
+        service, results = asyncio.run(scenario())
+        assert results == ["result:a", "result:a"]
+        assert service.calls == 1
+        assert service._inflight == {}
+
+    def test_owner_cancellation_does_not_cancel_waiters(self):
+        """Cancelling the first caller leaves the shared call running for the others"""
+        async def scenario():
+            service = SlowService()
+            owner = asyncio.create_task(service.fetch("a"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(service.fetch("a"))
+            await asyncio.sleep(0)
+
+            owner.cancel()
+            await asyncio.sleep(0)
+            service.release.set()
+
+            result = await waiter
+            return service, owner, waiter, result
+
+        service, owner, waiter, result = asyncio.run(scenario())
+        assert owner.cancelled()
+        assert not waiter.cancelled()
+        assert result == "result:a"
+        assert service.calls == 1
+
+    def test_different_arguments_are_not_coalesced(self):
+        """Calls with different arguments issue separate requests"""
+        async def scenario():
+            service = SlowService()
+            service.release.set()
+            return service, await asyncio.gather(service.fetch("a"), service.fetch("b"))
+
+        service, results = asyncio.run(scenario())
+        assert results == ["result:a", "result:b"]
+        assert service.calls == 2
+
+
+class TestDiskCache:
+    """DiskCache tests"""
+
+    def test_set_prunes_expired_entries(self, tmp_path):
+        """Writing an entry removes rows that have already expired"""
+        cache = DiskCache(tmp_path / "cache.db")
+        cache.set("stale", "old", ttl=0)
+        cache.set("forever", "kept")
+
+        cache.set("fresh", "new", ttl=60)
+
+        keys = {row[0] for row in cache._db.execute("SELECT key FROM cache")}
+        cache.close()
+        assert keys == {"forever", "fresh"}
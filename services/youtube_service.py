@@ -20,11 +20,17 @@ from pathlib import Path
 import httpx
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 import isodate
 
 from config.rate_limiter import RateLimiter, APIRateLimitDecorator
 from config.error_handler import APIErrorHandler, handle_api_errors
 from config.logger_config import get_api_logger
+from services._cache import DiskCache, acache, coalesce
+
+
+# Channel metadata changes slowly, so it is kept on disk for a day
+_CHANNEL_DISK_CACHE_TTL = 86400
 
 
 @dataclass
@@ -136,9 +142,15 @@ class YouTubeService:
         self.cache_ttl = 300  # 5 minutes
         self._cache: Dict[str, Tuple[Any, float]] = {}
         
+        # Pending calls shared between identical concurrent callers (see coalesce)
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        
         if cache_dir:
             cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Persistent cache for slowly changing metadata, reused across runs
+        self._disk_cache = DiskCache(cache_dir / "youtube_cache.db") if cache_dir else None
+        
         # YouTube API client
         self.youtube = build('youtube', 'v3', developerKey=api_key)
         
@@ -158,6 +170,11 @@ class YouTubeService:
         self.logger.info("YouTube service initialized")
     
     @handle_api_errors(None, 'youtube', 'get_channel_info')  # Will be set in __post_init__
+    @coalesce()
+    @acache(
+        ttl=_CHANNEL_DISK_CACHE_TTL,
+        key=lambda channel_id, use_cache: f"channel:{channel_id}" if use_cache else None
+    )
     async def get_channel_info(self, channel_id: str, use_cache: bool = True) -> Optional[YouTubeChannel]:
         """
         Get comprehensive channel information
@@ -178,6 +195,7 @@ class YouTubeService:
                 self.logger.debug(f"Using cached channel info for {channel_id}")
                 return YouTubeChannel(**cached_data)
         
+        await self.rate_limiter.youtube.acquire(1)  # channels.list costs 1 quota unit
         await self.rate_limiter.wait_if_needed('youtube', 'channels')
         
         try:
@@ -195,25 +213,7 @@ class YouTubeService:
                 self.logger.warning(f"Channel not found: {channel_id}")
                 return None
             
-            item = response['items'][0]
-            snippet = item['snippet']
-            statistics = item['statistics']
-            content_details = item.get('contentDetails', {})
-            
-            # Parse channel data
-            channel = YouTubeChannel(
-                channel_id=channel_id,
-                title=snippet['title'],
-                description=snippet.get('description', ''),
-                subscriber_count=int(statistics.get('subscriberCount', 0)),
-                video_count=int(statistics.get('videoCount', 0)),
-                view_count=int(statistics.get('viewCount', 0)),
-                published_at=datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
-                thumbnail_url=snippet['thumbnails']['default']['url'],
-                country=snippet.get('country'),
-                default_language=snippet.get('defaultLanguage'),
-                uploads_playlist_id=content_details.get('relatedPlaylists', {}).get('uploads')
-            )
+            channel = self._parse_channel_item(response['items'][0])
             
             # Cache the result
             if use_cache:
@@ -229,7 +229,83 @@ class YouTubeService:
             self.logger.error(f"Unexpected error getting channel {channel_id}: {e}")
             raise
     
+    async def get_channels_info(
+        self,
+        channel_ids: List[str],
+        use_cache: bool = True
+    ) -> Dict[str, YouTubeChannel]:
+        """
+        Get information for several channels with batched channels.list calls
+        
+        Args:
+            channel_ids: YouTube channel IDs
+            use_cache: Whether to use cached data
+            
+        Returns:
+            Dict mapping channel IDs to YouTubeChannel objects (missing channels are omitted)
+        """
+        channels = {}
+        missing_ids = []
+        
+        for channel_id in channel_ids:
+            cached_data = self._get_cached(f"channel_{channel_id}") if use_cache else None
+            if cached_data:
+                channels[channel_id] = YouTubeChannel(**cached_data)
+                continue
+            
+            # Shares entries with get_channel_info's disk cache
+            if use_cache and self._disk_cache:
+                hit, channel = self._disk_cache.get(f"channel:{channel_id}")
+                if hit:
+                    channels[channel_id] = channel
+                    continue
+            
+            missing_ids.append(channel_id)
+        
+        try:
+            # channels.list accepts up to 50 comma-separated IDs per request
+            for i in range(0, len(missing_ids), 50):
+                await self.rate_limiter.youtube.acquire(1)  # channels.list costs 1 quota unit
+                await self.rate_limiter.wait_if_needed('youtube', 'channels')
+                
+                request = self.youtube.channels().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(missing_ids[i:i+50]),
+                    maxResults=50
+                )
+                
+                response = request.execute()
+                self.quota_used += 1  # channels.list costs 1 quota unit
+                
+                for item in response.get('items', []):
+                    channel = self._parse_channel_item(item)
+                    channels[channel.channel_id] = channel
+                    
+                    if use_cache:
+                        self._set_cache(f"channel_{channel.channel_id}", channel.__dict__)
+                        if self._disk_cache:
+                            self._disk_cache.set(
+                                f"channel:{channel.channel_id}", channel, _CHANNEL_DISK_CACHE_TTL
+                            )
+            
+            for channel_id in missing_ids:
+                if channel_id not in channels:
+                    self.logger.warning(f"Channel not found: {channel_id}")
+            
+            self.logger.info(f"Retrieved info for {len(channels)}/{len(channel_ids)} channels")
+            return channels
+            
+        except HttpError as e:
+            self.logger.error(f"YouTube API error getting channels {missing_ids}: {e}")
+            await self.error_handler.handle_error(e, 'youtube', 'get_channels_info')
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error getting channels {missing_ids}: {e}")
+            await self.error_handler.handle_error(e, 'youtube', 'get_channels_info')
+            raise
+    
     @handle_api_errors(None, 'youtube', 'get_recent_videos')
+    @coalesce()
     async def get_recent_videos(
         self,
         channel_id: str,
@@ -264,6 +340,7 @@ class YouTubeService:
             self.logger.error(f"Could not get uploads playlist for channel {channel_id}")
             return []
         
+        await self.rate_limiter.youtube.acquire(1)  # playlistItems.list costs 1 quota unit
         await self.rate_limiter.wait_if_needed('youtube', 'playlist_items')
         
         try:
@@ -309,6 +386,100 @@ class YouTubeService:
             self.logger.error(f"Unexpected error getting recent videos for {channel_id}: {e}")
             raise
     
+    async def get_recent_videos_batch(
+        self,
+        channel_ids: List[str],
+        max_results: int = 50,
+        published_after: Optional[datetime] = None
+    ) -> Dict[str, List[YouTubeVideo]]:
+        """
+        Get recent videos from several channels
+        
+        Uploads playlists are resolved with one batched channels.list call,
+        the playlists are listed concurrently, and all videos are hydrated
+        with shared videos.list calls of up to 50 IDs each.
+        
+        Args:
+            channel_ids: YouTube channel IDs
+            max_results: Maximum number of videos to retrieve per channel
+            published_after: Only get videos published after this time
+            
+        Returns:
+            Dict mapping channel IDs to lists of YouTubeVideo objects
+        """
+        channels = await self.get_channels_info(channel_ids)
+        playlists = {
+            channel_id: channel.uploads_playlist_id
+            for channel_id, channel in channels.items()
+            if channel.uploads_playlist_id
+        }
+        
+        for channel_id in channel_ids:
+            if channel_id not in playlists:
+                self.logger.error(f"Could not get uploads playlist for channel {channel_id}")
+        
+        try:
+            responses = await asyncio.gather(*(
+                self._list_playlist_items(playlist_id, max_results, published_after)
+                for playlist_id in playlists.values()
+            ))
+            
+            video_ids = []
+            video_snippets = {}
+            
+            for response in responses:
+                for item in response.get('items', []):
+                    video_id = item['contentDetails']['videoId']
+                    video_ids.append(video_id)
+                    video_snippets[video_id] = item['snippet']
+            
+            videos_by_channel = {channel_id: [] for channel_id in playlists}
+            
+            for video in await self._get_video_details(video_ids, video_snippets):
+                if video.channel_id in videos_by_channel:
+                    videos_by_channel[video.channel_id].append(video)
+            
+            self.logger.info(f"Retrieved {len(video_ids)} recent videos from {len(playlists)} channels")
+            return videos_by_channel
+            
+        except HttpError as e:
+            self.logger.error(f"YouTube API error getting recent videos for {channel_ids}: {e}")
+            await self.error_handler.handle_error(e, 'youtube', 'get_recent_videos_batch')
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error getting recent videos for {channel_ids}: {e}")
+            await self.error_handler.handle_error(e, 'youtube', 'get_recent_videos_batch')
+            raise
+    
+    async def _list_playlist_items(
+        self,
+        playlist_id: str,
+        max_results: int,
+        published_after: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        List a playlist page in a worker thread
+        
+        Each call gets its own HTTP connection because the shared client's
+        transport is not thread-safe.
+        """
+        await self.rate_limiter.youtube.acquire(1)  # playlistItems.list costs 1 quota unit
+        await self.rate_limiter.wait_if_needed('youtube', 'playlist_items')
+        
+        request_params = {
+            'part': 'snippet,contentDetails',
+            'playlistId': playlist_id,
+            'maxResults': min(max_results, 50)  # YouTube API limit
+        }
+        
+        if published_after:
+            request_params['publishedAfter'] = published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        request = self.youtube.playlistItems().list(**request_params)
+        response = await asyncio.to_thread(request.execute, http=build_http())
+        self.quota_used += 1  # playlistItems.list costs 1 quota unit
+        return response
+    
     async def _get_video_details(self, video_ids: List[str], snippets: Dict[str, Any]) -> List[YouTubeVideo]:
         """
         Get detailed information for multiple videos
@@ -323,8 +494,6 @@ class YouTubeService:
         if not video_ids:
             return []
         
-        await self.rate_limiter.wait_if_needed('youtube', 'videos')
-        
         try:
             # Request video details in batches (API allows up to 50 IDs per request)
             all_videos = []
@@ -332,6 +501,9 @@ class YouTubeService:
             for i in range(0, len(video_ids), 50):
                 batch_ids = video_ids[i:i+50]
                 
+                await self.rate_limiter.youtube.acquire(1)  # videos.list costs 1 quota unit
+                await self.rate_limiter.wait_if_needed('youtube', 'videos')
+                
                 request = self.youtube.videos().list(
                     part='snippet,contentDetails,statistics',
                     id=','.join(batch_ids)
@@ -345,7 +517,7 @@ class YouTubeService:
                     if video:
                         all_videos.append(video)
                 
-                # Small delay between batches
+                # Small delay between batches (the daily quota bucket does not pace calls)
                 if i + 50 < len(video_ids):
                     await asyncio.sleep(0.1)
             
@@ -358,6 +530,34 @@ class YouTubeService:
             self.logger.error(f"Unexpected error getting video details: {e}")
             raise
     
+    def _parse_channel_item(self, item: Dict[str, Any]) -> YouTubeChannel:
+        """
+        Parse YouTube API channel item into YouTubeChannel object
+        
+        Args:
+            item: Channel item from YouTube API
+            
+        Returns:
+            YouTubeChannel object
+        """
+        snippet = item['snippet']
+        statistics = item['statistics']
+        content_details = item.get('contentDetails', {})
+        
+        return YouTubeChannel(
+            channel_id=item['id'],
+            title=snippet['title'],
+            description=snippet.get('description', ''),
+            subscriber_count=int(statistics.get('subscriberCount', 0)),
+            video_count=int(statistics.get('videoCount', 0)),
+            view_count=int(statistics.get('viewCount', 0)),
+            published_at=datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
+            thumbnail_url=snippet['thumbnails']['default']['url'],
+            country=snippet.get('country'),
+            default_language=snippet.get('defaultLanguage'),
+            uploads_playlist_id=content_details.get('relatedPlaylists', {}).get('uploads')
+        )
+    
     def _parse_video_item(self, item: Dict[str, Any]) -> Optional[YouTubeVideo]:
         """
         Parse YouTube API video item into YouTubeVideo object